@@ -10,45 +10,142 @@ This hook:
 3. Outputs narration prompt to stdout (prepended to user's prompt)
 """
 
+import hashlib
 import json
+import os
 import sys
+import types
 from pathlib import Path
 
+# Rendered prompts are cached per user, one file per checkout, prompt.py
+# content and verbosity/mode combination
+PROMPT_CACHE_DIR = Path.home() / ".cache" / "talk-to-me" / "prompts"
+
+# Debug logging is off unless CLAUDE_HOOK_DEBUG=1; when on, lines are
+# buffered and written with a single append at exit
+DEBUG = os.getenv("CLAUDE_HOOK_DEBUG") == "1"
+DEBUG_LOG = Path("/tmp/claude-hook-inject-debug.log")
+_log_lines = []
+
+
+def _log(message):
+    """Queue a debug log line."""
+    if DEBUG:
+        _log_lines.append(message + "\n")
+
+
+def _flush_log():
+    """Append all queued debug lines to the log file in one write."""
+    if not _log_lines:
+        return
+    try:
+        with open(DEBUG_LOG, "a") as f:
+            f.write("".join(_log_lines))
+    except OSError:
+        pass
+    _log_lines.clear()
+
+
+def read_narration_mode(mode_file):
+    """Read the narration mode, defaulting to auto when unset."""
+    # Straight open instead of exists() + read: one lookup per prompt
+    try:
+        return mode_file.read_text().strip() or "auto"
+    except FileNotFoundError:
+        return "auto"
+
+
+def _render_prompt(source_path, source, verbosity, mode):
+    """Render the narration prompt from the given prompt.py source.
+
+    The module is built from the same bytes the cache key hashes, so the
+    cached text always belongs to that exact prompt.py - never to an
+    installed or already imported src.prompt.
+    """
+    module = types.ModuleType("_narration_prompt")
+    module.__file__ = str(source_path)
+    exec(compile(source, str(source_path), "exec"), module.__dict__)
+    return module.get_narration_prompt(verbosity, mode)
+
+
+def _prompt_cache_file(source_path, source, verbosity, mode):
+    """Get the cache file for a rendered prompt.
+
+    The name hashes the resolved path and the bytes of src/prompt.py, so an
+    edited prompt module or another checkout never reuses a stale entry.
+    """
+    digest = hashlib.sha256()
+    digest.update(str(source_path).encode("utf-8") + b"\0")
+    digest.update(source + b"\0")
+    digest.update(f"{verbosity}\0{mode}".encode("utf-8"))
+    return PROMPT_CACHE_DIR / f"prompt-{digest.hexdigest()}.txt"
+
+
+def _read_own_file(path):
+    """Read a cache file only if it belongs to this user and nobody else can write it."""
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_NOFOLLOW", 0))
+    with os.fdopen(fd, encoding="utf-8") as f:
+        st = os.fstat(f.fileno())
+        if hasattr(os, "getuid") and (st.st_uid != os.getuid() or st.st_mode & 0o022):
+            raise PermissionError(f"Refusing untrusted prompt cache: {path}")
+        return f.read()
+
+
+def load_narration_prompt(project_dir, verbosity, mode):
+    """Get the narration prompt, reusing this user's cached copy.
+
+    A cache hit reads prompt.py to hash it but never executes it.
+    """
+    source_path = (project_dir / "src" / "prompt.py").resolve()
+    source = source_path.read_bytes()
+    cache_file = _prompt_cache_file(source_path, source, verbosity, mode)
+
+    try:
+        prompt = _read_own_file(cache_file)
+        _log(f"  Prompt cache hit: {cache_file}")
+        return prompt
+    except OSError:
+        pass
+
+    prompt = _render_prompt(source_path, source, verbosity, mode)
+
+    try:
+        PROMPT_CACHE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(prompt)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        pass  # Cache is an optimization only
+
+    return prompt
+
+
 def main():
-    # Debug logging
-    with open("/tmp/claude-hook-inject-debug.log", "a") as f:
-        f.write(f"[{Path(__file__).name}] Hook called at {__import__('datetime').datetime.now()}\n")
+    _log(f"[{Path(__file__).name}] Hook called at {__import__('datetime').datetime.now()}")
 
     try:
         # Read hook input from stdin
-        input_data = json.load(sys.stdin)
+        input_data = json.loads(sys.stdin.buffer.read())
 
         # Check if narration is enabled (from environment or default to true)
-        import os
         narration_enabled = os.getenv("NARRATION_ENABLED", "true").lower() == "true"
 
         if not narration_enabled:
             # Narration disabled - just exit, Claude will receive original prompt
             sys.exit(0)
 
-        # Get project directory and import narration prompt
         project_dir = Path(__file__).parent.parent
-        sys.path.insert(0, str(project_dir))
-
-        from src.prompt import get_narration_prompt
 
         # Get verbosity level
         verbosity = os.getenv("NARRATION_VERBOSITY", "medium")
 
         # Get narration mode
-        mode_file = project_dir / ".claude" / "narration-mode.txt"
-        if mode_file.exists():
-            mode = mode_file.read_text().strip()
-        else:
-            mode = "auto"
+        mode = read_narration_mode(project_dir / ".claude" / "narration-mode.txt")
 
         # Get the narration system prompt
-        narration_prompt = get_narration_prompt(verbosity, mode)
+        narration_prompt = load_narration_prompt(project_dir, verbosity, mode)
 
         # Output to stdout - this will be prepended to user's prompt
         print(narration_prompt)
@@ -58,8 +155,12 @@ def main():
 
     except Exception as e:
         # Log error to stderr but don't block
+        _log(f"  ERROR: {e}")
         print(f"Hook error: {e}", file=sys.stderr)
         sys.exit(0)  # Exit 0 so prompt still goes through
 
+    finally:
+        _flush_log()
+
 if __name__ == "__main__":
     main()
@@ -11,130 +11,335 @@ This hook:
 4. Speaks narration using configured TTS provider (runs in background)
 """
 
+import hashlib
+import itertools
 import json
+import os
 import sys
 import subprocess
 from pathlib import Path
 
+try:
+    # Faster parsing of transcript lines; stdlib json is the fallback
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+# Remembers how far into each transcript we have already parsed, so each Stop
+# hook only reads the lines appended since the previous turn. Entries hold
+# conversation text, so they are kept per user with owner-only permissions.
+TRANSCRIPT_CACHE_DIR = Path.home() / ".cache" / "talk-to-me" / "transcripts"
+
+# Block size for scanning the transcript backwards from EOF
+REVERSE_CHUNK_SIZE = 64 * 1024
+
+# Debug logging is off unless CLAUDE_HOOK_DEBUG=1; when on, lines are
+# buffered and written with a single append at exit
+DEBUG = os.getenv("CLAUDE_HOOK_DEBUG") == "1"
+DEBUG_LOG = Path("/tmp/claude-hook-stop-debug.log")
+_log_lines = []
+
+
+def _log(message):
+    """Queue a debug log line."""
+    if DEBUG:
+        _log_lines.append(message + "\n")
+
+
+def _flush_log():
+    """Append all queued debug lines to the log file in one write."""
+    if not _log_lines:
+        return
+    try:
+        with open(DEBUG_LOG, "a") as f:
+            f.write("".join(_log_lines))
+    except OSError:
+        pass
+    _log_lines.clear()
+
+
+def _message_text(entry):
+    """Return the text of a transcript entry if it is an assistant message."""
+    if not isinstance(entry, dict):
+        return None
+
+    # Role is nested in the message object
+    msg = entry.get("message", {})
+    if msg.get("role") != "assistant":
+        return None
+
+    content = msg.get("content", "")
+    if isinstance(content, list):
+        # Content is array of content blocks
+        return "\n".join(
+            block.get("text", "")
+            for block in content
+            if block.get("type") == "text"
+        )
+    elif isinstance(content, str):
+        return content
+    return None
+
+
+def _transcript_cache_file(transcript_path):
+    """Get the cache file for a transcript, named by a hash of its resolved path."""
+    resolved = str(Path(transcript_path).resolve())
+    digest = hashlib.sha256(resolved.encode("utf-8")).hexdigest()
+    return TRANSCRIPT_CACHE_DIR / f"transcript-{digest}.json"
+
+
+def _load_transcript_cache(transcript_path):
+    """Load cached parse state for this transcript, or None.
+
+    The cache is ignored unless it belongs to this user and nobody else
+    can write to it.
+    """
+    try:
+        fd = os.open(
+            _transcript_cache_file(transcript_path),
+            os.O_RDONLY | getattr(os, "O_NOFOLLOW", 0),
+        )
+        with os.fdopen(fd, encoding="utf-8") as f:
+            st = os.fstat(f.fileno())
+            if hasattr(os, "getuid") and (st.st_uid != os.getuid() or st.st_mode & 0o022):
+                return None
+            cache = json.loads(f.read())
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(cache, dict) or cache.get("path") != str(transcript_path):
+        return None
+    return cache
+
+
+def _save_transcript_cache(transcript_path, size, offset, last_text):
+    """Persist parse state so the next call can resume from offset."""
+    try:
+        cache_file = _transcript_cache_file(transcript_path)
+        TRANSCRIPT_CACHE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(json.dumps({
+                "path": str(transcript_path),
+                "size": size,
+                "offset": offset,
+                "last_assistant_text": last_text,
+            }))
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        pass  # Cache is an optimization only
+
+
+def _reverse_lines(f, start, end, chunk_size=REVERSE_CHUNK_SIZE):
+    """Yield the lines of f between byte offsets start and end, newest first.
+
+    The first item is whatever follows the final newline (b"" when the
+    range ends on a line boundary), so callers can detect a line that is
+    still being written.
+    """
+    pos = end
+    pending = []  # Fragments of the line being assembled, newest first
+    while pos > start:
+        read = min(chunk_size, pos - start)
+        pos -= read
+        f.seek(pos)
+        chunk = f.read(read)
+
+        parts = chunk.split(b"\n")
+        if len(parts) == 1:
+            pending.append(chunk)
+            continue
+
+        pending.append(parts[-1])
+        yield b"".join(reversed(pending))
+        for line in reversed(parts[1:-1]):
+            yield line
+        pending = [parts[0]]
+
+    yield b"".join(reversed(pending))
+
+
 def extract_last_assistant_message(transcript_path):
-    """Extract the last assistant message from transcript."""
+    """Extract the last assistant message from transcript.
+
+    The transcript is scanned backwards from EOF and parsing stops at the
+    first assistant entry. Only bytes appended since the previous call are
+    scanned; the cached result is returned as-is when nothing was appended.
+    """
     try:
-        with open(transcript_path, 'r') as f:
-            lines = f.readlines()
+        size = os.stat(transcript_path).st_size
+        cache = _load_transcript_cache(transcript_path)
+
+        start, last_text = 0, None
+        if cache is not None:
+            if cache["size"] == size:
+                return cache["last_assistant_text"]
+            if cache["size"] < size:
+                # Transcript grew - only look at the new lines
+                start, last_text = cache["offset"], cache["last_assistant_text"]
+            # Otherwise the file was truncated/rewritten: full rescan
 
         # Transcript is JSONL format - each line is a message
-        assistant_messages = []
-        for line in lines:
-            if not line.strip():
-                continue
-            try:
-                entry = json.loads(line)
-                # Check if this is an assistant message (role is nested in message object)
-                msg = entry.get("message", {})
-                if msg.get("role") == "assistant":
-                    content = msg.get("content", "")
-                    if isinstance(content, list):
-                        # Content is array of content blocks
-                        text_parts = [
-                            block.get("text", "")
-                            for block in content
-                            if block.get("type") == "text"
-                        ]
-                        assistant_messages.append("\n".join(text_parts))
-                    elif isinstance(content, str):
-                        assistant_messages.append(content)
-            except json.JSONDecodeError:
-                continue
-
-        # Return the last assistant message
-        return assistant_messages[-1] if assistant_messages else None
+        with open(transcript_path, 'rb') as f:
+            lines = _reverse_lines(f, start, size)
+
+            # A final record without a trailing newline counts if it parses;
+            # otherwise it is still being written and is left for next call
+            partial = next(lines)
+            end = size
+            if partial.strip():
+                try:
+                    json_loads(partial)
+                except ValueError:
+                    end = size - len(partial)
+                else:
+                    lines = itertools.chain((partial,), lines)
+
+            for line in lines:
+                if not line.strip():
+                    continue
+                try:
+                    text = _message_text(json_loads(line))
+                except ValueError:  # Covers both json and orjson decode errors
+                    continue
+                if text is not None:
+                    last_text = text
+                    break
+
+        _save_transcript_cache(transcript_path, end, end, last_text)
+        return last_text
 
     except Exception as e:
         print(f"Error reading transcript: {e}", file=sys.stderr)
         return None
 
-def main():
-    # Debug logging
-    debug_log = Path("/tmp/claude-hook-stop-debug.log")
 
+def _parse_env_file(path):
+    """Parse simple KEY=VALUE lines from a .env file.
+
+    Handles comments, 'export' prefixes and quoted values - enough for the
+    project's .env without importing python-dotenv.
+    """
+    values = {}
     try:
-        import os
+        text = path.read_text()
+    except OSError:
+        return values
+
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        if line.startswith("export "):
+            line = line[len("export "):].lstrip()
+
+        key, sep, value = line.partition("=")
+        key, value = key.strip(), value.strip()
+        if not sep or not key:
+            continue
+
+        if value[:1] in ("'", '"'):
+            end = value.find(value[0], 1)
+            value = value[1:end] if end != -1 else value[1:]
+        else:
+            # Drop inline comments ("VALUE  # comment")
+            cuts = [i for i in (value.find(" #"), value.find("\t#")) if i != -1]
+            if cuts:
+                value = value[:min(cuts)].rstrip()
+
+        values[key] = value
+
+    return values
+
 
-        with open(debug_log, "a") as f:
-            f.write(f"[process_response.py] Hook called at {__import__('datetime').datetime.now()}\n")
+def _tts_environment(project_dir):
+    """Environment for the TTS child with .env already applied.
+
+    Like load_dotenv(), existing environment variables take precedence.
+    """
+    env = {**_parse_env_file(project_dir / ".env"), **os.environ}
+    env["TTM_ENV_LOADED"] = "1"
+    return env
+
+
+def main():
+    try:
+        _log(f"[process_response.py] Hook called at {__import__('datetime').datetime.now()}")
 
         # Check if narration and auto-speak are enabled
         narration_enabled = os.getenv("NARRATION_ENABLED", "true").lower() == "true"
         auto_speak = os.getenv("AUTO_SPEAK", "true").lower() == "true"
 
         if not narration_enabled or not auto_speak:
-            with open(debug_log, "a") as f:
-                f.write(f"  Narration disabled: enabled={narration_enabled}, auto_speak={auto_speak}\n")
+            _log(f"  Narration disabled: enabled={narration_enabled}, auto_speak={auto_speak}")
             sys.exit(0)
 
         # Read hook input from stdin
-        input_data = json.load(sys.stdin)
+        input_data = json.loads(sys.stdin.buffer.read())
 
         # Get transcript path
         transcript_path = input_data.get("transcript_path")
-        with open(debug_log, "a") as f:
-            f.write(f"  Transcript path: {transcript_path}\n")
+        _log(f"  Transcript path: {transcript_path}")
 
         if not transcript_path or not Path(transcript_path).exists():
-            with open(debug_log, "a") as f:
-                f.write(f"  Transcript not found\n")
+            _log("  Transcript not found")
             sys.exit(0)
 
         # Extract last assistant message
         response = extract_last_assistant_message(transcript_path)
-        with open(debug_log, "a") as f:
-            f.write(f"  Response length: {len(response) if response else 0}\n")
+        _log(f"  Response length: {len(response) if response else 0}")
 
         if not response:
-            with open(debug_log, "a") as f:
-                f.write(f"  No assistant response found\n")
+            _log("  No assistant response found")
             sys.exit(0)
 
-        # Get project directory and import extractor
+        # Import extractor from the checkout this hook belongs to, ahead of
+        # any installed 'src' package
         project_dir = Path(__file__).parent.parent
         sys.path.insert(0, str(project_dir))
-
         from src.extractor import extract_narration
 
         # Extract narration
         narration = extract_narration(response)
-        with open(debug_log, "a") as f:
-            f.write(f"  Narration extracted: {narration[:50] if narration else 'None'}...\n")
+        _log(f"  Narration extracted: {narration[:50] if narration else 'None'}...")
 
         if not narration:
             # No narration tags found
-            with open(debug_log, "a") as f:
-                f.write(f"  No narration tags found\n")
+            _log("  No narration tags found")
             sys.exit(0)
 
         # Speak narration in background (don't block)
         speak_script = project_dir / "hooks" / "speak_narration_bg.py"
-        with open(debug_log, "a") as f:
-            f.write(f"  Launching TTS: {speak_script}\n")
+        _log(f"  Launching TTS: {speak_script}")
 
-        subprocess.Popen(
-            [sys.executable, str(speak_script), narration],
+        # Detached session so TTS outlives the hook; narration goes over
+        # stdin rather than argv to avoid argument size limits
+        proc = subprocess.Popen(
+            [sys.executable, str(speak_script)],
+            stdin=subprocess.PIPE,
             stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL
+            stderr=subprocess.DEVNULL,
+            env=_tts_environment(project_dir),
+            start_new_session=True,
+            close_fds=True,
         )
+        proc.stdin.write(narration.encode("utf-8"))
+        proc.stdin.close()
 
-        with open(debug_log, "a") as f:
-            f.write(f"  TTS launched successfully\n")
+        _log("  TTS launched successfully")
 
         # Exit immediately (don't wait for TTS)
         sys.exit(0)
 
     except Exception as e:
         # Log error to stderr but don't block
-        with open(debug_log, "a") as f:
-            f.write(f"  ERROR: {e}\n")
+        _log(f"  ERROR: {e}")
         print(f"Hook error: {e}", file=sys.stderr)
         sys.exit(0)
 
+    finally:
+        _flush_log()
+
 if __name__ == "__main__":
     main()
@@ -3,37 +3,83 @@
 Background TTS Script
 ====================
 Speaks narration text using configured TTS provider.
+Text is taken from the first argument, or read from stdin when none is given.
+With --worker, stays running and speaks one JSON-encoded {"text": ...}
+narration per stdin line, so a long-lived caller pays startup only once.
 Runs independently in background, logs errors but doesn't block.
 """
 
+import json
+import os
 import sys
 from pathlib import Path
 
-def main():
-    if len(sys.argv) < 2:
-        sys.exit(1)
 
-    narration_text = sys.argv[1]
+def _log_error(e):
+    """Log error to a file (can't use stderr in background process)."""
+    error_log = Path("/tmp/claude-tts-error.log")
+    with open(error_log, "a") as f:
+        f.write(f"TTS Error: {e}\n")
 
-    try:
-        # Get project directory and load environment
-        project_dir = Path(__file__).parent.parent
-        sys.path.insert(0, str(project_dir))
 
-        # Load .env file to get TTS_PROVIDER and API keys
+def _load_speak():
+    """Load the environment and return the TTS speak function."""
+    # Get project directory and load environment
+    project_dir = Path(__file__).parent.parent
+
+    # Load .env file to get TTS_PROVIDER and API keys, unless the
+    # launching hook already resolved it into our environment
+    if os.environ.get("TTM_ENV_LOADED") != "1":
         from dotenv import load_dotenv
         load_dotenv(project_dir / ".env")
 
-        from src.voice import speak
+    # The checkout this hook belongs to wins over any installed 'src'
+    sys.path.insert(0, str(project_dir))
+    from src.voice import speak
+
+    return speak
+
+
+def run_worker():
+    """Speak narrations from stdin, one JSON line each, until EOF."""
+    try:
+        speak = _load_speak()
+    except Exception as e:
+        _log_error(e)
+        sys.exit(1)
+
+    for line in sys.stdin.buffer:
+        try:
+            narration_text = json.loads(line)["text"]
+            if narration_text.strip():
+                speak(narration_text)
+        except Exception as e:
+            # A bad line or failed narration shouldn't stop the worker
+            _log_error(e)
+
+
+def main():
+    if len(sys.argv) >= 2 and sys.argv[1] == "--worker":
+        run_worker()
+        return
+
+    # Narration comes from argv (manual use) or stdin (hooks)
+    if len(sys.argv) >= 2:
+        narration_text = sys.argv[1]
+    else:
+        narration_text = sys.stdin.buffer.read().decode("utf-8")
+
+    if not narration_text.strip():
+        sys.exit(1)
+
+    try:
+        speak = _load_speak()
 
         # Speak the narration
         speak(narration_text)
 
     except Exception as e:
-        # Log error to a file (can't use stderr in background process)
-        error_log = Path("/tmp/claude-tts-error.log")
-        with open(error_log, "a") as f:
-            f.write(f"TTS Error: {e}\n")
+        _log_error(e)
 
 if __name__ == "__main__":
     main()
@@ -4,10 +4,13 @@ Talk-to-Me Claude CLI - Python Installation Script
 Usage: python3 install.py
 """
 
+import importlib.util
 import json
 import os
+import shutil
 import subprocess
 import sys
+import threading
 from pathlib import Path
 
 
@@ -48,6 +51,42 @@ def check_python_version():
     return True
 
 
+def requirements_satisfied(requirements_file):
+    """Check installed distributions against requirements.txt without pip.
+
+    Returns False (so pip runs) if anything is missing, mismatched, or
+    cannot be checked.
+    """
+    try:
+        from importlib import metadata
+        from packaging.requirements import InvalidRequirement, Requirement
+    except ImportError:
+        return False
+
+    for line in requirements_file.read_text().splitlines():
+        line = line.split("#", 1)[0].strip()
+        if not line:
+            continue
+        if line.startswith("-"):
+            return False  # pip options (-e, -r, ...) - let pip handle them
+
+        try:
+            requirement = Requirement(line)
+        except InvalidRequirement:
+            return False
+        if requirement.marker is not None and not requirement.marker.evaluate():
+            continue
+
+        try:
+            version = metadata.version(requirement.name)
+        except metadata.PackageNotFoundError:
+            return False
+        if not requirement.specifier.contains(version, prereleases=True):
+            return False
+
+    return True
+
+
 def install_dependencies(project_dir):
     """Install Python dependencies from requirements.txt."""
     print_step("📦 Installing Python dependencies...")
@@ -57,9 +96,17 @@ def install_dependencies(project_dir):
         print_warning("requirements.txt not found, skipping")
         return
 
+    if requirements_satisfied(requirements_file):
+        print_success("Dependencies already installed")
+        return
+
     try:
         subprocess.run(
-            [sys.executable, "-m", "pip", "install", "-q", "-r", str(requirements_file)],
+            [
+                sys.executable, "-m", "pip", "install", "-q",
+                "--prefer-binary", "--no-input",
+                "-r", str(requirements_file),
+            ],
             check=True,
             capture_output=True
         )
@@ -127,6 +174,27 @@ SAMPLE_RATE=24000
     print_warning("IMPORTANT: Edit .env and add your API keys!")
 
 
+def write_json_atomic(path, data):
+    """Write JSON via a temp file and rename, so a crash never leaves it truncated.
+
+    A symlinked config is written through to its target, and the file keeps
+    its existing permissions (0600 for a new file, since it may hold keys).
+    """
+    path = Path(path).resolve()
+    try:
+        mode = path.stat().st_mode & 0o7777
+    except FileNotFoundError:
+        mode = 0o600
+
+    tmp_path = path.with_name(path.name + ".tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "wb") as f:
+        f.write(json.dumps(data, indent=2).encode("utf-8"))
+    # Set explicitly: the umask must not narrow or widen the original mode
+    os.chmod(tmp_path, mode)
+    os.replace(tmp_path, path)
+
+
 def setup_mcp_server(project_dir):
     """Configure MCP server in ~/.claude.json."""
     print_step("🔧 Configuring MCP server...")
@@ -149,7 +217,7 @@ def setup_mcp_server(project_dir):
                 "talk-to-me-claude": mcp_config
             }
         }
-        claude_config.write_text(json.dumps(config, indent=2))
+        write_json_atomic(claude_config, config)
         print_success(f"Created {claude_config} with talk-to-me-claude MCP server")
         return
 
@@ -176,7 +244,7 @@ def setup_mcp_server(project_dir):
     if response == 'y':
         # Backup original
         backup_file = Path(str(claude_config) + ".backup")
-        backup_file.write_text(claude_config.read_text())
+        shutil.copyfile(claude_config, backup_file)
 
         # Add MCP server
         if 'mcpServers' not in config:
@@ -185,8 +253,7 @@ def setup_mcp_server(project_dir):
         config['mcpServers']['talk-to-me-claude'] = mcp_config
 
         # Write back
-        with open(claude_config, 'w') as f:
-            json.dump(config, f, indent=2)
+        write_json_atomic(claude_config, config)
 
         print_success(f"Added talk-to-me-claude to {claude_config}")
         print_success(f"Backup saved to {backup_file}")
@@ -221,26 +288,42 @@ def set_default_mode(project_dir):
     print_success("Default mode: auto")
 
 
-def run_tests(project_dir):
+def run_tests(project_dir, timeout=60):
     """Run tests to verify installation."""
     print_step("🧪 Running tests to verify installation...")
 
+    # No point forking an interpreter just to find pytest is missing
+    if importlib.util.find_spec("pytest") is None:
+        print_warning("Could not run tests (pytest is not installed yet)")
+        return
+
     try:
-        result = subprocess.run(
+        proc = subprocess.Popen(
             [sys.executable, "-m", "pytest", str(project_dir / "tests"), "-q", "--tb=short"],
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
             text=True,
-            timeout=60
         )
+    except OSError:
+        print_warning("Could not run tests")
+        return
 
-        if result.returncode == 0:
-            print_success("All tests passed")
-        else:
-            print_warning("Some tests failed (this may be okay for initial setup)")
-            if result.stdout:
-                print(result.stdout)
-    except (subprocess.CalledProcessError, subprocess.TimeoutExpired, FileNotFoundError):
-        print_warning("Could not run tests (pytest may not be installed yet)")
+    # Stream output as it arrives instead of buffering it all in memory
+    timer = threading.Timer(timeout, proc.kill)
+    timer.start()
+    try:
+        for line in proc.stdout:
+            print(line, end="")
+        returncode = proc.wait()
+    finally:
+        timer.cancel()
+
+    if returncode == 0:
+        print_success("All tests passed")
+    elif returncode < 0:
+        print_warning(f"Tests did not finish within {timeout}s")
+    else:
+        print_warning("Some tests failed (this may be okay for initial setup)")
 
 
 def print_summary(project_dir):
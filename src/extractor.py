@@ -7,6 +7,78 @@ tags, cleaning the text for optimal TTS output.
 import re
 from typing import Optional, Tuple
 
+# Compiled once at import; these run for every narration we speak.
+# The one tag pattern serves extraction, removal and splitting.
+_RE_VOICE = re.compile(
+    r'\[VOICE_NARRATION\](.*?)\[/VOICE_NARRATION\]', re.DOTALL | re.IGNORECASE
+)
+
+# Markdown that sounds bad when spoken, matched in a single pass.
+# DOTALL lets bold/link spans cross newlines, which become spaces anyway.
+_RE_MD = re.compile(
+    r'(?P<code>```[\s\S]*?```)'         # code blocks (```...```)
+    r'|(?P<tick>`)'                     # inline code markers (`)
+    r'|(?P<hdr>#+\s*)'                  # headers (#)
+    r'|\*\*?(?P<bold>.*?)\*\*?'         # bold/italic (**text** or *text*)
+    r'|\[(?P<link>.*?)\]\(.*?\)'        # links ([text](url))
+    r'|(?P<url>https?://[^\s`]+)'       # URLs (they sound terrible when spoken)
+    r'|(?P<nl>\n+)',                    # newlines
+    re.DOTALL,
+)
+_RE_WS = re.compile(r'\s+')
+_RE_STRAY_SYM = re.compile(r'\s+[^\w\s,.!?-]+\s+')
+
+# Checkmarks and other symbols that sound weird, stripped in one pass.
+# '⚠️' is U+26A0 followed by the U+FE0F variation selector.
+_SYMBOL_TABLE = str.maketrans({
+    '✅': None, '✓': None, '❌': None, '✗': None, '⚠': None, '\ufe0f': None,
+    '🎉': None, '🎤': None, '🔊': None, '📢': None, '→': None, '•': None,
+    '—': '-', '–': '-',
+})
+
+# Emoji ranges. Kept to emoji blocks only so CJK text, math symbols and
+# other non-BMP characters in narration survive cleaning.
+_RE_EMOJI = re.compile("["
+    "\U0001F300-\U0001FAFF"  # pictographs, emoticons, transport, supplemental
+    "\U0001F1E0-\U0001F1FF"  # flags (iOS)
+    "\u2600-\u27BF"          # misc symbols & dingbats
+    "\u2B50-\u2B55"          # stars and circles
+    "\u231a\u23cf\u23e9\u3030"
+    "\ufe0f"                 # variation selector
+    "\u200d"                 # zero-width joiner
+    "]+")
+
+
+def _has_narration_tag(text: str) -> bool:
+    """Cheap substring check run before the (case-insensitive) tag regex.
+
+    Mixed-case tags fall through to the regex itself rather than to a
+    lowered copy of the whole response.
+    """
+    return (
+        '[VOICE_NARRATION]' in text
+        or '[voice_narration]' in text
+        or _RE_VOICE.search(text) is not None
+    )
+
+
+def _single_block(text: str) -> Optional[Tuple[str, str, str]]:
+    """Split text around its only narration block without the regex.
+
+    Applies when the text holds exactly one upper-case tag pair and no other
+    ']' at all, which rules out any further tag in any case.
+
+    Returns:
+        (before, narration, after), or None if the regex path is needed
+    """
+    before, sep, rest = text.partition('[VOICE_NARRATION]')
+    if not sep:
+        return None
+    block, sep, after = rest.partition('[/VOICE_NARRATION]')
+    if not sep or text.count(']') != 2:
+        return None
+    return before, block, after
+
 
 def extract_narration(text: str, multi_point: bool = True) -> Optional[str]:
     """Extract voice narration from Claude's output.
@@ -19,12 +91,16 @@ def extract_narration(text: str, multi_point: bool = True) -> Optional[str]:
     Returns:
         Extracted narration text, or None if no narration found
     """
-    # Match [VOICE_NARRATION]...[/VOICE_NARRATION] tags
-    pattern = r'\[VOICE_NARRATION\](.*?)\[/VOICE_NARRATION\]'
+    if not _has_narration_tag(text):
+        return None
+
+    single = _single_block(text)
+    if single is not None:
+        return clean_narration(single[1])
 
     if multi_point:
         # Find ALL narration blocks
-        matches = re.findall(pattern, text, re.DOTALL | re.IGNORECASE)
+        matches = _RE_VOICE.findall(text)
 
         if not matches:
             return None
@@ -37,7 +113,7 @@ def extract_narration(text: str, multi_point: bool = True) -> Optional[str]:
         return ". ".join(cleaned_blocks)
     else:
         # Legacy: Only extract first block
-        match = re.search(pattern, text, re.DOTALL | re.IGNORECASE)
+        match = _RE_VOICE.search(text)
 
         if not match:
             return None
@@ -46,6 +122,17 @@ def extract_narration(text: str, multi_point: bool = True) -> Optional[str]:
         return clean_narration(narration)
 
 
+def _strip_markdown(match: re.Match) -> str:
+    """Replacement callback for _RE_MD."""
+    kind = match.lastgroup
+    if kind == 'nl':
+        return ' '
+    if kind in ('bold', 'link'):
+        # Keep the visible text, itself cleaned of nested markup
+        return _RE_MD.sub(_strip_markdown, match.group(kind))
+    return ''
+
+
 def clean_narration(narration: str) -> str:
     """Clean narration text for optimal TTS output.
 
@@ -66,71 +153,20 @@ def clean_narration(narration: str) -> str:
     # Remove leading/trailing whitespace
     cleaned = narration.strip()
 
-    # Replace multiple newlines with single space
-    cleaned = re.sub(r'\n+', ' ', cleaned)
-
-    # Remove markdown code blocks (```...```)
-    cleaned = re.sub(r'```[\s\S]*?```', '', cleaned)
-
-    # Remove inline code markers (`)
-    cleaned = cleaned.replace('`', '')
-
-    # Remove markdown headers (#)
-    cleaned = re.sub(r'#+\s*', '', cleaned)
-
-    # Remove markdown bold/italic (**text** or *text*)
-    cleaned = re.sub(r'\*\*?(.*?)\*\*?', r'\1', cleaned)
-
-    # Remove markdown links ([text](url))
-    cleaned = re.sub(r'\[(.*?)\]\(.*?\)', r'\1', cleaned)
+    # Remove markdown, URLs and newlines in one pass
+    cleaned = _RE_MD.sub(_strip_markdown, cleaned)
 
     # Remove checkmarks and other symbols that sound weird
-    cleaned = cleaned.replace('✅', '')
-    cleaned = cleaned.replace('✓', '')
-    cleaned = cleaned.replace('❌', '')
-    cleaned = cleaned.replace('✗', '')
-    cleaned = cleaned.replace('⚠️', '')
-    cleaned = cleaned.replace('🎉', '')
-    cleaned = cleaned.replace('🎤', '')
-    cleaned = cleaned.replace('🔊', '')
-    cleaned = cleaned.replace('📢', '')
-    cleaned = cleaned.replace('→', '')
-    cleaned = cleaned.replace('•', '')
-    cleaned = cleaned.replace('—', '-')
-    cleaned = cleaned.replace('–', '-')
-
-    # Remove emoji ranges (comprehensive)
-    # This covers most emoji characters
-    emoji_pattern = re.compile("["
-        u"\U0001F600-\U0001F64F"  # emoticons
-        u"\U0001F300-\U0001F5FF"  # symbols & pictographs
-        u"\U0001F680-\U0001F6FF"  # transport & map symbols
-        u"\U0001F1E0-\U0001F1FF"  # flags (iOS)
-        u"\U00002500-\U00002BEF"  # chinese char
-        u"\U00002702-\U000027B0"
-        u"\U00002702-\U000027B0"
-        u"\U000024C2-\U0001F251"
-        u"\U0001f926-\U0001f937"
-        u"\U00010000-\U0010ffff"
-        u"\u2640-\u2642"
-        u"\u2600-\u2B55"
-        u"\u200d"
-        u"\u23cf"
-        u"\u23e9"
-        u"\u231a"
-        u"\ufe0f"  # dingbats
-        u"\u3030"
-        "]+", flags=re.UNICODE)
-    cleaned = emoji_pattern.sub(r'', cleaned)
+    cleaned = cleaned.translate(_SYMBOL_TABLE)
 
-    # Replace multiple spaces with single space
-    cleaned = re.sub(r'\s+', ' ', cleaned)
+    # Remove emoji ranges
+    cleaned = _RE_EMOJI.sub('', cleaned)
 
-    # Remove URLs (they sound terrible when spoken)
-    cleaned = re.sub(r'https?://\S+', '', cleaned)
+    # Replace multiple spaces with single space
+    cleaned = _RE_WS.sub(' ', cleaned)
 
     # Remove standalone symbols and punctuation that might remain
-    cleaned = re.sub(r'\s+[^\w\s,.!?-]+\s+', ' ', cleaned)
+    cleaned = _RE_STRAY_SYM.sub(' ', cleaned)
 
     return cleaned.strip()
 
@@ -146,8 +182,10 @@ def remove_narration_tags(text: str) -> str:
     Returns:
         Text with narration tags removed
     """
-    pattern = r'\[VOICE_NARRATION\].*?\[/VOICE_NARRATION\]'
-    return re.sub(pattern, '', text, flags=re.DOTALL | re.IGNORECASE).strip()
+    if not _has_narration_tag(text):
+        return text.strip()
+
+    return _RE_VOICE.sub('', text).strip()
 
 
 def split_output(text: str) -> Tuple[str, Optional[str]]:
@@ -159,8 +197,26 @@ def split_output(text: str) -> Tuple[str, Optional[str]]:
     Returns:
         Tuple of (terminal_text, narration_text)
     """
-    narration = extract_narration(text)
-    terminal_text = remove_narration_tags(text)
+    if not _has_narration_tag(text):
+        return text.strip(), None
+
+    single = _single_block(text)
+    if single is not None:
+        before, block, after = single
+        return (before + after).strip(), clean_narration(block)
+
+    # One scan: collect narration blocks and the text between them
+    parts = []
+    blocks = []
+    last = 0
+    for match in _RE_VOICE.finditer(text):
+        parts.append(text[last:match.start()])
+        blocks.append(clean_narration(match.group(1)))
+        last = match.end()
+    parts.append(text[last:])
+
+    terminal_text = ''.join(parts).strip()
+    narration = ". ".join(blocks) if blocks else None
 
     return terminal_text, narration
 
@@ -3,35 +3,35 @@
 Defines the resources exposed by the MCP server for conversation access.
 """
 
-import json
 from typing import List
 
 from mcp.types import Resource, TextContent, ResourceTemplate
+from pydantic import AnyUrl
 
-from .session import SessionManager
+from .session import SessionManager, dumps
 
 
-def create_resources() -> List[Resource]:
-    """Create the list of MCP resources.
+def _build_resources() -> List[Resource]:
+    """Build the list of MCP resources.
 
     Returns:
         List of Resource objects
     """
     return [
         Resource(
-            uri="conversation://current",
+            uri=AnyUrl("conversation://current"),
             name="Current Conversation",
             description="The current conversation session state",
             mimeType="application/json"
         ),
         Resource(
-            uri="conversation://history",
+            uri=AnyUrl("conversation://history"),
             name="Conversation History",
             description="Full conversation history in the current session",
             mimeType="application/json"
         ),
         Resource(
-            uri="conversation://settings",
+            uri=AnyUrl("conversation://settings"),
             name="Voice Settings",
             description="Current voice and narration settings",
             mimeType="application/json"
@@ -39,8 +39,8 @@ def create_resources() -> List[Resource]:
     ]
 
 
-def create_resource_templates() -> List[ResourceTemplate]:
-    """Create resource templates for dynamic resources.
+def _build_resource_templates() -> List[ResourceTemplate]:
+    """Build resource templates for dynamic resources.
 
     Returns:
         List of ResourceTemplate objects
@@ -55,10 +55,40 @@ def create_resource_templates() -> List[ResourceTemplate]:
     ]
 
 
+# These definitions never change, so they are built once at import
+_RESOURCES = tuple(_build_resources())
+_RESOURCE_TEMPLATES = tuple(_build_resource_templates())
+
+
+def create_resources() -> List[Resource]:
+    """Get the list of MCP resources.
+
+    Returns:
+        List of shared Resource objects (treat as read-only)
+    """
+    return list(_RESOURCES)
+
+
+def create_resource_templates() -> List[ResourceTemplate]:
+    """Get resource templates for dynamic resources.
+
+    Returns:
+        List of shared ResourceTemplate objects (treat as read-only)
+    """
+    return list(_RESOURCE_TEMPLATES)
+
+
 class ResourceHandler:
     """Handles reading of MCP resources."""
 
-    def __init__(self, session_manager: SessionManager):
+    # Static resource URIs mapped to the method that reads them
+    _STATIC_ROUTES = {
+        "conversation://current": "read_current_conversation",
+        "conversation://history": "read_conversation_history",
+        "conversation://settings": "read_voice_settings",
+    }
+
+    def __init__(self, session_manager: SessionManager) -> None:
         """Initialize resource handler.
 
         Args:
@@ -73,7 +103,7 @@ class ResourceHandler:
             JSON string of current session
         """
         session = self.session_manager.get_current_session()
-        return json.dumps(session.to_dict(), indent=2)
+        return session.to_json()
 
     async def read_conversation_history(self) -> str:
         """Read the conversation history resource.
@@ -82,12 +112,12 @@ class ResourceHandler:
             JSON string of conversation history
         """
         session = self.session_manager.get_current_session()
-        history_data = {
-            "session_id": session.session_id,
-            "message_count": len(session.history),
-            "messages": [msg.to_dict() for msg in session.history]
-        }
-        return json.dumps(history_data, indent=2)
+        return '{"session_id":%s,"message_count":%d,"token_estimate":%d,"messages":%s}' % (
+            dumps(session.session_id),
+            len(session.history),
+            session.token_budget_used(),
+            session.history_json(),
+        )
 
     async def read_voice_settings(self) -> str:
         """Read the voice settings resource.
@@ -96,7 +126,7 @@ class ResourceHandler:
             JSON string of voice settings
         """
         session = self.session_manager.get_current_session()
-        return json.dumps(session.voice_settings, indent=2)
+        return dumps(session.voice_settings)
 
     async def read_session(self, session_id: str) -> str:
         """Read a specific session resource.
@@ -114,7 +144,7 @@ class ResourceHandler:
         if session is None:
             raise ValueError(f"Session not found: {session_id}")
 
-        return json.dumps(session.to_dict(), indent=2)
+        return session.to_json()
 
     async def handle_read_resource(self, uri: str) -> List[TextContent]:
         """Route resource reads to the appropriate handler.
@@ -126,15 +156,11 @@ class ResourceHandler:
             List of TextContent responses
         """
         try:
-            if uri == "conversation://current":
-                content = await self.read_current_conversation()
-            elif uri == "conversation://history":
-                content = await self.read_conversation_history()
-            elif uri == "conversation://settings":
-                content = await self.read_voice_settings()
+            method = self._STATIC_ROUTES.get(uri)
+            if method is not None:
+                content = await getattr(self, method)()
             elif uri.startswith("conversation://session/"):
-                session_id = uri.split("/")[-1]
-                content = await self.read_session(session_id)
+                content = await self.read_session(uri.rpartition("/")[2])
             else:
                 return [TextContent(
                     type="text",
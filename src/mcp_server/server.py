@@ -45,19 +45,25 @@ def create_server() -> Server:
     async def list_tools() -> list:
         """List available tools."""
         tools = create_tools()
-        logger.info(f"Listed {len(tools)} tools")
+        logger.info("Listed %d tools", len(tools))
         return tools
 
     @server.call_tool()
     async def call_tool(name: str, arguments: Dict[str, Any]) -> list[TextContent]:
         """Execute a tool."""
-        logger.info(f"Tool called: {name} with args: {arguments}")
+        logger.info("Tool called: %s", name)
+        # Arguments can carry long message text, so only format them when asked
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Tool %s args: %r", name, arguments)
         try:
             result = await tool_handler.handle_call_tool(name, arguments)
-            logger.info(f"Tool {name} executed successfully")
+            logger.info("Tool %s executed successfully", name)
             return result
         except Exception as e:
-            logger.error(f"Error executing tool {name}: {e}", exc_info=True)
+            logger.error(
+                "Error executing tool %s: %s", name, e,
+                exc_info=logger.isEnabledFor(logging.DEBUG),
+            )
             return [TextContent(
                 type="text",
                 text=f"Error: {str(e)}"
@@ -67,26 +73,29 @@ def create_server() -> Server:
     async def list_resources() -> list:
         """List available resources."""
         resources = create_resources()
-        logger.info(f"Listed {len(resources)} resources")
+        logger.info("Listed %d resources", len(resources))
         return resources
 
     @server.list_resource_templates()
     async def list_resource_templates() -> list:
         """List available resource templates."""
         templates = create_resource_templates()
-        logger.info(f"Listed {len(templates)} resource templates")
+        logger.info("Listed %d resource templates", len(templates))
         return templates
 
     @server.read_resource()
     async def read_resource(uri: str) -> list[TextContent]:
         """Read a resource."""
-        logger.info(f"Resource read: {uri}")
+        logger.info("Resource read: %s", uri)
         try:
             result = await resource_handler.handle_read_resource(uri)
-            logger.info(f"Resource {uri} read successfully")
+            logger.info("Resource %s read successfully", uri)
             return result
         except Exception as e:
-            logger.error(f"Error reading resource {uri}: {e}", exc_info=True)
+            logger.error(
+                "Error reading resource %s: %s", uri, e,
+                exc_info=logger.isEnabledFor(logging.DEBUG),
+            )
             return [TextContent(
                 type="text",
                 text=f"Error: {str(e)}"
@@ -120,7 +129,7 @@ def run():
     except KeyboardInterrupt:
         logger.info("Server shutdown requested")
     except Exception as e:
-        logger.error(f"Server error: {e}", exc_info=True)
+        logger.error("Server error: %s", e, exc_info=True)
         raise
 
 
@@ -3,51 +3,222 @@
 Handles conversation history tracking, session state, and message storage.
 """
 
+import json
+import logging
+import os
+import re
+import sys
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from datetime import datetime
-from typing import Dict, List, Optional
-from uuid import uuid4
+from datetime import datetime, timedelta
+from itertools import islice
+from pathlib import Path
+from typing import Any, Deque, Dict, Final, KeysView, List, Optional, Tuple
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
-@dataclass
+logger = logging.getLogger(__name__)
+
+# Oldest messages are dropped once a session holds this many
+MAX_HISTORY = 10_000
+
+# Fixed per-message overhead (role, framing) added to the char/4 token estimate
+MESSAGE_TOKEN_OVERHEAD = 8
+
+# Voice settings a new session starts with; copied, never handed out directly
+DEFAULT_VOICE_SETTINGS: Final[Dict[str, Any]] = {
+    "tts_provider": "local",  # Default to local for safety
+    "stt_provider": "openai",
+    "tts_voice": "default",
+    "tts_speed": 1.0,
+    "auto_speak": True,
+    "narration_enabled": True,
+    "verbosity": "medium",
+}
+
+# Messages left verbatim when older history is summarized
+KEEP_RECENT = 20
+
+# Summary excerpt length and keyword count
+_EXCERPT_CHARS = 80
+_SUMMARY_KEYWORDS = 5
+_RE_WORD = re.compile(r"[A-Za-z][A-Za-z_-]{5,}")
+
+# Archive appends run here, off the event loop that calls add_message();
+# one thread keeps them in order
+_archive_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="history-archive")
+
+# Without orjson, reuse one compact encoder instead of building one per call
+_ENCODER = json.JSONEncoder(separators=(",", ":"))
+
+
+def dumps(obj) -> str:
+    """Encode obj as compact JSON text, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj).decode("utf-8")
+    return _ENCODER.encode(obj)
+
+
+@dataclass(slots=True)
 class ConversationMessage:
     """A single message in a conversation."""
     role: str  # 'user' or 'assistant'
     content: str
     narration: Optional[str] = None
     timestamp: datetime = field(default_factory=datetime.now)
+    meta: Optional[Dict[str, Any]] = None
+    token_estimate: int = field(default=0, init=False, repr=False, compare=False)
+    _json: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Estimate the token count and reset the serialization cache."""
+        # Roughly four characters per token
+        self.token_estimate = (
+            (len(self.content) + len(self.narration or "")) // 4 + MESSAGE_TOKEN_OVERHEAD
+        )
+        # Set explicitly: compiled (mypyc) classes don't fall back to the
+        # class-level default for init=False fields
+        self._json = None
 
     def to_dict(self) -> Dict:
         """Convert to dictionary for serialization."""
-        return {
+        data = {
             "role": self.role,
             "content": self.content,
             "narration": self.narration,
             "timestamp": self.timestamp.isoformat(),
         }
+        if self.meta is not None:
+            data["meta"] = self.meta
+        return data
 
+    def to_json(self) -> str:
+        """Serialize to a JSON string.
 
-@dataclass
+        Messages don't change once added to a session, so the encoding is
+        computed on first use and reused by every later history read.
+        """
+        if self._json is None:
+            self._json = dumps(self.to_dict())
+        return self._json
+
+
+def _archive_dir() -> Optional[Path]:
+    """Get the directory summarized messages are archived to.
+
+    Returns:
+        Archive directory, or None when HISTORY_ARCHIVE=false
+    """
+    if os.getenv("HISTORY_ARCHIVE", "true").lower() == "false":
+        return None
+    default_dir = Path.home() / ".talk-to-me-claude" / "archives"
+    return Path(os.getenv("HISTORY_ARCHIVE_DIR", str(default_dir))).expanduser()
+
+
+def _history_token_budget() -> Optional[int]:
+    """Get the token budget new sessions summarize their history past.
+
+    Returns:
+        HISTORY_TOKEN_BUDGET as a positive int, or None (never summarize)
+        when it is unset, zero or not a number
+    """
+    value = os.getenv("HISTORY_TOKEN_BUDGET", "").strip()
+    if not value:
+        return None
+    try:
+        budget = int(value)
+    except ValueError:
+        logger.warning("Ignoring HISTORY_TOKEN_BUDGET=%r: not an integer", value)
+        return None
+    return budget if budget > 0 else None
+
+
+def _append_archive(path: Path, lines: str) -> None:
+    """Append lines to an archive file only this user can read."""
+    try:
+        # History holds full conversation text, so keep it owner-only
+        path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600)
+        with os.fdopen(fd, "a", encoding="utf-8") as f:
+            f.write(lines)
+    except OSError as e:
+        # Summarizing still bounds the history; losing the archive copy
+        # shouldn't break the conversation
+        logger.warning("Could not archive history: %s", e)
+
+
+def _excerpt(text: str) -> str:
+    """Shorten text to one line of at most _EXCERPT_CHARS characters."""
+    text = " ".join(text.split())
+    if len(text) > _EXCERPT_CHARS:
+        text = text[:_EXCERPT_CHARS - 3].rstrip() + "..."
+    return text
+
+
+def _summarize(messages: List[ConversationMessage], count: int) -> str:
+    """Describe messages without an LLM call.
+
+    Lists role counts, the first and last message and the most frequent
+    longer words.
+
+    Args:
+        messages: Messages being replaced, oldest first
+        count: Number of original messages they stand for
+
+    Returns:
+        Summary text
+    """
+    roles = Counter(msg.role for msg in messages)
+    words = Counter(
+        word.lower() for msg in messages for word in _RE_WORD.findall(msg.content)
+    )
+    lines = [
+        f"Summary of {count} earlier messages "
+        f"({', '.join(f'{n} {role}' for role, n in roles.items())}).",
+        f"First: [{messages[0].role}] {_excerpt(messages[0].content)}",
+        f"Last: [{messages[-1].role}] {_excerpt(messages[-1].content)}",
+    ]
+    if words:
+        keywords = ", ".join(word for word, _ in words.most_common(_SUMMARY_KEYWORDS))
+        lines.append(f"Keywords: {keywords}")
+    return "\n".join(lines)
+
+
+@dataclass(slots=True)
 class Session:
     """A conversation session with state and history."""
-    session_id: str = field(default_factory=lambda: str(uuid4()))
-    history: List[ConversationMessage] = field(default_factory=list)
-    voice_settings: Dict[str, any] = field(default_factory=dict)
+    # 128 random bits as hex, like uuid4().hex without building a UUID
+    session_id: str = field(default_factory=lambda: os.urandom(16).hex())
+    history: Deque[ConversationMessage] = field(
+        default_factory=lambda: deque(maxlen=MAX_HISTORY)
+    )
+    voice_settings: Dict[str, Any] = field(default_factory=dict)
     created_at: datetime = field(default_factory=datetime.now)
     last_activity: datetime = field(default_factory=datetime.now)
-
-    def __post_init__(self):
-        """Initialize default voice settings."""
+    max_history: int = MAX_HISTORY
+    # Older history is summarized once the token estimate passes this (None = never)
+    token_budget: Optional[int] = None
+    total_tokens: int = field(default=0, init=False, repr=False, compare=False)
+    _voice_controller: Optional[Any] = field(default=None, init=False, repr=False, compare=False)
+    # (first message, message count, finished JSON array)
+    _history_json: Optional[Tuple[ConversationMessage, int, str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """Initialize default voice settings and bound the history."""
+        self._voice_controller = None
+        self._history_json = None
+        if not isinstance(self.history, deque) or self.history.maxlen != self.max_history:
+            self.history = deque(self.history, maxlen=self.max_history)
+        self.total_tokens = sum(msg.token_estimate for msg in self.history)
         if not self.voice_settings:
-            self.voice_settings = {
-                "tts_provider": "local",  # Default to local for safety
-                "stt_provider": "openai",
-                "tts_voice": "default",
-                "tts_speed": 1.0,
-                "auto_speak": True,
-                "narration_enabled": True,
-                "verbosity": "medium",
-            }
+            self.voice_settings = DEFAULT_VOICE_SETTINGS.copy()
 
     def add_message(self, role: str, content: str, narration: Optional[str] = None) -> ConversationMessage:
         """Add a message to the conversation history.
@@ -61,14 +232,100 @@ class Session:
             The created ConversationMessage
         """
         message = ConversationMessage(
-            role=role,
+            # Roles decoded from tool arguments are fresh strings; share one copy
+            role=sys.intern(role),
             content=content,
             narration=narration,
         )
+        if len(self.history) == self.history.maxlen:
+            # append() is about to drop the oldest message
+            self.total_tokens -= self.history[0].token_estimate
         self.history.append(message)
-        self.last_activity = datetime.now()
+        self.total_tokens += message.token_estimate
+        # The message was just stamped; reuse it rather than reading the clock again
+        self.last_activity = message.timestamp
+        if self.token_budget is not None and self.total_tokens > self.token_budget:
+            # Keep as many recent messages as fill half the budget, leaving
+            # room for the summary and for new messages
+            self.summarize_and_evict(self._recent_within(self.token_budget // 2))
         return message
 
+    def _recent_within(self, tokens: int) -> int:
+        """Count the newest messages whose estimates fit in tokens (at least 1)."""
+        count = 0
+        for msg in reversed(self.history):
+            tokens -= msg.token_estimate
+            if tokens < 0:
+                break
+            count += 1
+        return max(count, 1)
+
+    def summarize_and_evict(self, keep_recent: int = KEEP_RECENT) -> Optional[ConversationMessage]:
+        """Replace all but the most recent messages with one summary message.
+
+        The replaced messages are appended to a monthly JSONL archive
+        (see _archive_dir) before they are dropped. Earlier summaries are
+        folded into the new one rather than archived again.
+
+        Args:
+            keep_recent: Number of newest messages kept verbatim
+
+        Returns:
+            The summary message, or None if there was nothing to summarize
+        """
+        keep_recent = max(keep_recent, 0)
+        old_count = len(self.history) - keep_recent
+        if old_count <= 0:
+            return None
+
+        old = list(islice(self.history, old_count))
+        recent = list(islice(self.history, old_count, None))
+
+        originals = [msg for msg in old if msg.meta is None]
+        summarized = sum(
+            msg.meta.get("summarized_count", 1) if msg.meta else 1 for msg in old
+        )
+        self._archive(originals)
+
+        summary = ConversationMessage(
+            role="system",
+            content=_summarize(old, summarized),
+            meta={"summarized_count": summarized},
+        )
+        self.history.clear()
+        self.history.append(summary)
+        self.history.extend(recent)
+        self.total_tokens = sum(msg.token_estimate for msg in self.history)
+        return summary
+
+    def _archive(self, messages: List[ConversationMessage]) -> None:
+        """Queue messages for this month's archive file, one JSON object per line.
+
+        The lines are built here; the file write happens on the archive
+        thread so add_message() never blocks on disk.
+        """
+        archive_dir = _archive_dir()
+        if archive_dir is None or not messages:
+            return
+        lines = "".join(
+            '{"session_id":%s,"message":%s}\n' % (dumps(self.session_id), msg.to_json())
+            for msg in messages
+        )
+        path = archive_dir / f"{datetime.now():%Y-%m}.jsonl"
+        _archive_executor.submit(_append_archive, path, lines)
+
+    def voice_controller(self) -> Any:
+        """Get the VoiceController for this session, creating it on first use.
+
+        Returns:
+            VoiceController bound to this session
+        """
+        if self._voice_controller is None:
+            # Imported here because voice_controller imports this module
+            from .voice_controller import VoiceController
+            self._voice_controller = VoiceController(self)
+        return self._voice_controller
+
     def get_history(self, limit: Optional[int] = None) -> List[ConversationMessage]:
         """Get conversation history.
 
@@ -79,15 +336,29 @@ class Session:
             List of ConversationMessage objects
         """
         if limit is None:
-            return self.history.copy()
-        return self.history[-limit:] if limit > 0 else []
+            return list(self.history)
+        if limit <= 0:
+            return []
+        # Walk back from the newest end so only `limit` messages are visited
+        recent = list(islice(reversed(self.history), limit))
+        recent.reverse()
+        return recent
 
     def clear(self) -> None:
         """Clear conversation history."""
-        self.history = []
+        self.history.clear()
+        self.total_tokens = 0
         self.last_activity = datetime.now()
 
-    def update_voice_settings(self, settings: Dict[str, any]) -> None:
+    def token_budget_used(self) -> int:
+        """Get the estimated number of tokens held in the history.
+
+        Returns:
+            Running total kept up to date by add_message and clear
+        """
+        return self.total_tokens
+
+    def update_voice_settings(self, settings: Dict[str, Any]) -> None:
         """Update voice settings.
 
         Args:
@@ -106,24 +377,66 @@ class Session:
             "last_activity": self.last_activity.isoformat(),
         }
 
+    def history_json(self) -> str:
+        """Serialize the history to a JSON array using cached message encodings.
+
+        History only grows at the end until messages are evicted or cleared,
+        so the finished array is kept: an unchanged history returns it as-is,
+        and newly added messages are spliced in before its closing bracket.
+        A different first message means the prefix is gone and the array is
+        rebuilt.
+        """
+        history = self.history
+        if not history:
+            return "[]"
+
+        cached = self._history_json
+        if cached is not None and cached[0] is history[0] and cached[1] <= len(history):
+            _, count, result = cached
+            if count == len(history):
+                return result
+            tail = ",".join(msg.to_json() for msg in islice(history, count, None))
+            result = "".join((result[:-1], ",", tail, "]"))
+        else:
+            result = "[" + ",".join(msg.to_json() for msg in history) + "]"
+
+        self._history_json = (history[0], len(history), result)
+        return result
+
+    def to_json(self) -> str:
+        """Serialize the session to JSON, equivalent to dumps(to_dict())."""
+        return (
+            '{"session_id":%s,"history":%s,"voice_settings":%s,'
+            '"created_at":%s,"last_activity":%s}'
+        ) % (
+            dumps(self.session_id),
+            self.history_json(),
+            dumps(self.voice_settings),
+            dumps(self.created_at.isoformat()),
+            dumps(self.last_activity.isoformat()),
+        )
+
 
 class SessionManager:
     """Manages multiple conversation sessions."""
 
-    def __init__(self):
+    def __init__(self) -> None:
         """Initialize the session manager."""
         self.sessions: Dict[str, Session] = {}
-        self._current_session_id: Optional[str] = None
+        # Held directly so the per-tool-call lookup is one attribute load
+        self._current_session: Optional[Session] = None
 
     def create_session(self) -> Session:
         """Create a new session.
 
+        Its token budget comes from HISTORY_TOKEN_BUDGET (unset = no budget).
+
         Returns:
             The created Session object
         """
-        session = Session()
+        session = Session(token_budget=_history_token_budget())
         self.sessions[session.session_id] = session
-        self._current_session_id = session.session_id
+        self._current_session = session
         return session
 
     def get_session(self, session_id: str) -> Optional[Session]:
@@ -147,12 +460,10 @@ class SessionManager:
             Session object
         """
         if session_id is None:
-            session_id = self._current_session_id
-
-        if session_id and session_id in self.sessions:
-            return self.sessions[session_id]
-
-        return self.create_session()
+            session = self._current_session
+        else:
+            session = self.sessions.get(session_id)
+        return session if session is not None else self.create_session()
 
     def get_current_session(self) -> Session:
         """Get the current active session, creating one if needed.
@@ -160,7 +471,8 @@ class SessionManager:
         Returns:
             Current Session object
         """
-        return self.get_or_create_session(self._current_session_id)
+        session = self._current_session
+        return session if session is not None else self.create_session()
 
     def set_current_session(self, session_id: str) -> bool:
         """Set the current active session.
@@ -171,10 +483,11 @@ class SessionManager:
         Returns:
             True if session exists and was set, False otherwise
         """
-        if session_id in self.sessions:
-            self._current_session_id = session_id
-            return True
-        return False
+        session = self.sessions.get(session_id)
+        if session is None:
+            return False
+        self._current_session = session
+        return True
 
     def delete_session(self, session_id: str) -> bool:
         """Delete a session.
@@ -186,19 +499,23 @@ class SessionManager:
             True if session was deleted, False if not found
         """
         if session_id in self.sessions:
-            del self.sessions[session_id]
-            if self._current_session_id == session_id:
-                self._current_session_id = None
+            session = self.sessions.pop(session_id)
+            # Release the microphone a voice chat may have left open
+            if session._voice_controller is not None:
+                session._voice_controller.close()
+            if self._current_session is session:
+                self._current_session = None
             return True
         return False
 
-    def list_sessions(self) -> List[str]:
+    def list_sessions(self) -> KeysView[str]:
         """List all session IDs.
 
         Returns:
-            List of session IDs
+            Live view of the session IDs; take tuple() of it before deleting
+            sessions while iterating
         """
-        return list(self.sessions.keys())
+        return self.sessions.keys()
 
     def cleanup_inactive_sessions(self, max_age_hours: int = 24) -> int:
         """Remove sessions inactive for more than max_age_hours.
@@ -209,13 +526,13 @@ class SessionManager:
         Returns:
             Number of sessions deleted
         """
-        now = datetime.now()
-        to_delete = []
-
-        for session_id, session in self.sessions.items():
-            age = (now - session.last_activity).total_seconds() / 3600
-            if age > max_age_hours:
-                to_delete.append(session_id)
+        # Compare against a single cutoff rather than computing each age
+        cutoff = datetime.now() - timedelta(hours=max_age_hours)
+        to_delete = [
+            session_id
+            for session_id, session in self.sessions.items()
+            if session.last_activity < cutoff
+        ]
 
         for session_id in to_delete:
             self.delete_session(session_id)
@@ -3,16 +3,16 @@
 Defines the tools exposed by the MCP server for conversation management.
 """
 
+import asyncio
 from typing import Any, Dict, List, Optional
 
 from mcp.types import Tool, TextContent
 
 from .session import SessionManager
-from .voice_controller import VoiceController
 
 
-def create_tools() -> List[Tool]:
-    """Create the list of MCP tools.
+def _build_tools() -> List[Tool]:
+    """Build the list of MCP tools.
 
     Returns:
         List of Tool objects
@@ -132,10 +132,30 @@ def create_tools() -> List[Tool]:
     ]
 
 
+# These definitions never change, so they are built once at import
+_TOOLS = tuple(_build_tools())
+
+
+def create_tools() -> List[Tool]:
+    """Get the list of MCP tools.
+
+    Returns:
+        List of shared Tool objects (treat as read-only)
+    """
+    return list(_TOOLS)
+
+
 class ToolHandler:
     """Handles execution of MCP tools."""
 
-    def __init__(self, session_manager: SessionManager):
+    # Arguments each tool's inputSchema marks as required, keyed by tool
+    # name; each tool is handled by the method of the same name
+    _REQUIRED_ARGS = {
+        tool.name: frozenset(tool.inputSchema.get("required", ()))
+        for tool in _TOOLS
+    }
+
+    def __init__(self, session_manager: SessionManager) -> None:
         """Initialize tool handler.
 
         Args:
@@ -152,34 +172,51 @@ class ToolHandler:
         Returns:
             List of TextContent responses
         """
-        text = arguments["text"]
-        use_voice = arguments.get("use_voice", False)
-        role = arguments.get("role", "user")
+        return await self.send_messages([arguments])
 
-        session = self.session_manager.get_current_session()
-        voice_controller = VoiceController(session)
+    async def send_messages(self, payloads: List[Dict[str, Any]]) -> List[TextContent]:
+        """Add several messages to the current session in one step.
+
+        The session is looked up once and all narration extraction runs in
+        a single worker thread, so a burst of messages (e.g. streamed
+        assistant chunks) costs one thread hop instead of one per message.
 
-        # Process message with voice if requested
-        if use_voice:
-            _, narration = voice_controller.process_message_sync(text, extract_voice=True)
-        else:
-            narration = None
+        Args:
+            payloads: send_message arguments, one dict per message
 
-        # Add to conversation history
-        message = session.add_message(role=role, content=text, narration=narration)
+        Returns:
+            List of TextContent responses, one per message
+        """
+        session = self.session_manager.get_current_session()
 
-        result = {
-            "status": "sent",
-            "message_role": message.role,
-            "message_content": message.content,
-            "narration": message.narration,
-            "timestamp": message.timestamp.isoformat()
-        }
+        # Process messages with voice if requested, off the event loop so
+        # other requests are served while narration is extracted and spoken
+        narrations: List[Optional[str]] = [None] * len(payloads)
+        voiced = [i for i, payload in enumerate(payloads) if payload.get("use_voice", False)]
+        if voiced:
+            voice_controller = session.voice_controller()
+
+            def extract() -> None:
+                for i in voiced:
+                    _, narrations[i] = voice_controller.process_message_sync(
+                        payloads[i]["text"], extract_voice=True
+                    )
+
+            await asyncio.to_thread(extract)
+
+        results = []
+        for payload, narration in zip(payloads, narrations):
+            text = payload["text"]
+            # Add to conversation history
+            session.add_message(
+                role=payload.get("role", "user"), content=text, narration=narration
+            )
+            results.append(TextContent(
+                type="text",
+                text=f"Message sent:\n{text}\n\nNarration: {narration or 'none'}"
+            ))
 
-        return [TextContent(
-            type="text",
-            text=f"Message sent:\n{text}\n\nNarration: {narration or 'none'}"
-        )]
+        return results
 
     async def get_conversation_history(self, arguments: Dict[str, Any]) -> List[TextContent]:
         """Handle get_conversation_history tool.
@@ -201,20 +238,18 @@ class ToolHandler:
                 text="No conversation history"
             )]
 
-        # Format history as text
-        lines = [f"Conversation history ({len(history)} messages):"]
-        lines.append("")
-
+        # Format history as text, one string per message
+        parts = [f"Conversation history ({len(history)} messages):\n"]
         for i, msg in enumerate(history, 1):
-            lines.append(f"{i}. [{msg.role}] ({msg.timestamp.strftime('%Y-%m-%d %H:%M:%S')})")
-            lines.append(f"   {msg.content}")
-            if msg.narration:
-                lines.append(f"   [Narration: {msg.narration}]")
-            lines.append("")
+            narration = f"   [Narration: {msg.narration}]\n" if msg.narration else ""
+            parts.append(
+                f"\n{i}. [{msg.role}] ({msg.timestamp:%Y-%m-%d %H:%M:%S})\n"
+                f"   {msg.content}\n{narration}"
+            )
 
         return [TextContent(
             type="text",
-            text="\n".join(lines)
+            text="".join(parts)
         )]
 
     async def clear_conversation(self, arguments: Dict[str, Any]) -> List[TextContent]:
@@ -245,7 +280,7 @@ class ToolHandler:
             List of TextContent responses
         """
         session = self.session_manager.get_current_session()
-        voice_controller = VoiceController(session)
+        voice_controller = session.voice_controller()
 
         # Update settings
         voice_controller.update_settings(**arguments)
@@ -292,10 +327,11 @@ class ToolHandler:
         duration = arguments.get("duration")
 
         session = self.session_manager.get_current_session()
-        voice_controller = VoiceController(session)
+        voice_controller = session.voice_controller()
 
         try:
-            text = voice_controller.listen(duration=duration)
+            # Recording blocks for its whole duration, so run it in a thread
+            text = await asyncio.to_thread(voice_controller.listen, duration=duration)
             return [TextContent(
                 type="text",
                 text=f"Transcribed: {text}"
@@ -316,20 +352,19 @@ class ToolHandler:
         Returns:
             List of TextContent responses
         """
-        handlers = {
-            "send_message": self.send_message,
-            "get_conversation_history": self.get_conversation_history,
-            "clear_conversation": self.clear_conversation,
-            "set_voice_settings": self.set_voice_settings,
-            "get_voice_settings": self.get_voice_settings,
-            "listen": self.listen,
-        }
-
-        handler = handlers.get(name)
-        if handler is None:
+        required = self._REQUIRED_ARGS.get(name)
+        if required is None:
             return [TextContent(
                 type="text",
                 text=f"Unknown tool: {name}"
             )]
 
-        return await handler(arguments)
+        # Report missing arguments directly instead of raising KeyError
+        missing = required - arguments.keys()
+        if missing:
+            return [TextContent(
+                type="text",
+                text=f"Missing required arguments for {name}: {', '.join(sorted(missing))}"
+            )]
+
+        return await getattr(self, name)(arguments)
@@ -4,8 +4,14 @@ Integrates TTS/STT functionality with session management.
 """
 
 import asyncio
+import atexit
+import json
+import logging
+import os
 import subprocess
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, Tuple
 
@@ -14,6 +20,70 @@ from ..voice.tts import get_tts_provider
 from ..voice.stt import get_stt_provider
 from .session import Session
 
+logger = logging.getLogger(__name__)
+
+# Background TTS script used by speak_async; it ships with the project, so
+# whether it exists is checked once rather than on every narration
+SPEAK_SCRIPT = Path(__file__).parent.parent.parent / "hooks" / "speak_narration_bg.py"
+SPEAK_SCRIPT_EXISTS = SPEAK_SCRIPT.exists()
+
+# One long-lived TTS worker shared by every session in this process
+_worker: Optional[subprocess.Popen] = None
+_worker_lock = threading.Lock()
+
+
+def _send_to_worker(text: str) -> None:
+    """Queue text on the background TTS worker, (re)starting it if needed.
+
+    Args:
+        text: Text to speak
+    """
+    global _worker
+    line = (json.dumps({"text": text}) + "\n").encode("utf-8")
+
+    with _worker_lock:
+        for attempt in range(2):
+            if _worker is None or _worker.poll() is not None:
+                _worker = subprocess.Popen(
+                    [sys.executable, str(SPEAK_SCRIPT), "--worker"],
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    start_new_session=True,
+                )
+            try:
+                _worker.stdin.write(line)
+                _worker.stdin.flush()
+                return
+            except OSError:
+                # Worker died between poll() and write; start a fresh one
+                _worker = None
+                if attempt:
+                    raise
+
+
+@atexit.register
+def _stop_worker() -> None:
+    """Close the worker's stdin so it finishes queued narrations and exits."""
+    if _worker is not None and _worker.poll() is None:
+        try:
+            _worker.stdin.close()
+        except OSError:
+            pass
+
+
+# In-process fallback when the script is missing; one thread keeps
+# narrations in order without holding up the caller
+_speech_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="tts")
+
+
+def _speak_logged(provider, text: str) -> None:
+    """Speak text with a provider, logging rather than raising failures."""
+    try:
+        provider.speak(text)
+    except Exception as e:
+        logger.error("TTS error: %s", e)
+
 
 class VoiceController:
     """Controls voice input/output for a conversation session."""
@@ -27,6 +97,8 @@ class VoiceController:
         self.session = session
         self._tts_provider = None
         self._stt_provider = None
+        self._tts_key = None
+        self._stt_key = None
 
     def _get_tts_provider(self):
         """Get or create TTS provider based on session settings."""
@@ -34,8 +106,11 @@ class VoiceController:
         voice = self.session.voice_settings.get("tts_voice", "default")
         speed = self.session.voice_settings.get("tts_speed", 1.0)
 
-        # Cache provider if settings haven't changed
-        if self._tts_provider is None:
+        # Cache provider if settings haven't changed; settings may also be
+        # updated on the session directly, so compare against what was used
+        key = (provider_name, voice, speed)
+        if self._tts_provider is None or key != self._tts_key:
+            self._tts_key = key
             self._tts_provider = get_tts_provider(
                 provider=provider_name,
                 voice=voice if voice != "default" else None,
@@ -49,11 +124,23 @@ class VoiceController:
         provider_name = self.session.voice_settings.get("stt_provider", "openai")
 
         # Cache provider if settings haven't changed
-        if self._stt_provider is None:
+        if self._stt_provider is None or provider_name != self._stt_key:
+            self._close_stt_provider()
+            self._stt_key = provider_name
             self._stt_provider = get_stt_provider(provider=provider_name)
 
         return self._stt_provider
 
+    def _close_stt_provider(self) -> None:
+        """Release the cached STT provider's microphone stream, if any."""
+        if self._stt_provider is not None:
+            self._stt_provider.close()
+            self._stt_provider = None
+
+    def close(self) -> None:
+        """Release audio resources held by this controller."""
+        self._close_stt_provider()
+
     def extract_and_speak_narration(self, text: str) -> Optional[str]:
         """Extract narration from text and speak it if enabled.
 
@@ -77,33 +164,29 @@ class VoiceController:
     def speak_async(self, text: str) -> None:
         """Speak text asynchronously (non-blocking).
 
-        Uses the background TTS script to avoid blocking the main process.
+        Narrations are queued on a persistent background TTS worker, so
+        only the first one pays interpreter and provider startup.
 
         Args:
             text: Text to speak
         """
+        # VOICE_DRY_RUN=true extracts narrations but never speaks them
+        if os.getenv("VOICE_DRY_RUN", "false").lower() in ("1", "true"):
+            return
+
         try:
             # Use the existing background TTS script
-            project_dir = Path(__file__).parent.parent.parent
-            speak_script = project_dir / "hooks" / "speak_narration_bg.py"
-
-            if speak_script.exists():
-                # Launch in background
-                subprocess.Popen(
-                    [sys.executable, str(speak_script), text],
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL
-                )
+            if SPEAK_SCRIPT_EXISTS:
+                _send_to_worker(text)
             else:
-                # Fallback: use TTS directly but in a fire-and-forget manner
-                # This is synchronous but we're not waiting for it
+                # Fallback: synthesize and play in this process, off the
+                # caller's thread
                 provider = self._get_tts_provider()
-                provider.speak(text)
+                _speech_executor.submit(_speak_logged, provider, text)
 
         except Exception as e:
             # Log error but don't raise - voice failure shouldn't break conversation
-            import logging
-            logging.error(f"TTS error: {e}")
+            logger.error("TTS error: %s", e)
 
     def speak_sync(self, text: str) -> None:
         """Speak text synchronously (blocking).
@@ -115,8 +198,7 @@ class VoiceController:
             provider = self._get_tts_provider()
             provider.speak(text)
         except Exception as e:
-            import logging
-            logging.error(f"TTS error: {e}")
+            logger.error("TTS error: %s", e)
 
     def listen(self, duration: Optional[float] = None) -> str:
         """Listen for voice input and transcribe.
@@ -129,10 +211,15 @@ class VoiceController:
         """
         try:
             provider = self._get_stt_provider()
-            return provider.listen(duration=duration)
+            try:
+                # stdout is the MCP transport, so status lines only go to the log
+                return provider.listen(duration=duration, verbose=False)
+            finally:
+                # Don't hold the microphone between tool calls; the provider
+                # (and its API client) stays cached for the next listen
+                provider.close()
         except Exception as e:
-            import logging
-            logging.error(f"STT error: {e}")
+            logger.error("STT error: %s", e)
             raise
 
     def update_settings(self, **settings) -> None:
@@ -148,7 +235,7 @@ class VoiceController:
             self._tts_provider = None
 
         if "stt_provider" in settings:
-            self._stt_provider = None
+            self._close_stt_provider()
 
     async def process_message_async(self, text: str, extract_voice: bool = True) -> Tuple[str, Optional[str]]:
         """Process a message asynchronously, extracting and speaking narration if enabled.
@@ -160,12 +247,10 @@ class VoiceController:
         Returns:
             Tuple of (text, narration)
         """
-        narration = None
-
-        if extract_voice and self.session.voice_settings.get("narration_enabled", True):
-            narration = self.extract_and_speak_narration(text)
-
-        return text, narration
+        # Same work as the sync variant, run in a thread so extraction and
+        # queueing on the TTS worker (which may start it, or wait on a full
+        # pipe) stay off the event loop
+        return await asyncio.to_thread(self.process_message_sync, text, extract_voice)
 
     def process_message_sync(self, text: str, extract_voice: bool = True) -> Tuple[str, Optional[str]]:
         """Process a message synchronously, extracting and speaking narration if enabled.
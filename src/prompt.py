@@ -133,24 +133,14 @@ Adjust your narration length accordingly while maintaining the conversational st
 """
 
 
-def get_narration_prompt(verbosity: str = "medium", mode: str = "auto") -> str:
-    """Get the system prompt for voice narration mode.
-
-    Args:
-        verbosity: Level of narration detail (brief, medium, detailed)
-        mode: When to narrate (coding_only, conversational, auto)
-
-    Returns:
-        System prompt string with narration instructions
-    """
-    verbosity_guidance = {
-        "brief": "Keep narration to 1 sentence maximum.",
-        "medium": "Keep narration to 2-3 sentences.",
-        "detailed": "Provide 3-5 sentences of explanation.",
-    }
-
-    mode_guidance = {
-        "coding_only": """
+_VERBOSITY_GUIDANCE = {
+    "brief": "Keep narration to 1 sentence maximum.",
+    "medium": "Keep narration to 2-3 sentences.",
+    "detailed": "Provide 3-5 sentences of explanation.",
+}
+
+_MODE_GUIDANCE = {
+    "coding_only": """
 **CODING_ONLY MODE**: Only include [VOICE_NARRATION] tags when you are:
 - Editing, creating, or deleting files
 - Fixing bugs or errors
@@ -164,7 +154,7 @@ DO NOT narrate when:
 - Having discussions
 - Providing recommendations without code changes
 """,
-        "conversational": """
+    "conversational": """
 **CONVERSATIONAL MODE**: Include [VOICE_NARRATION] tags for ALL responses:
 - All coding tasks
 - Q&A and explanations
@@ -173,21 +163,50 @@ DO NOT narrate when:
 
 Always provide narration to help user follow along audibly.
 """,
-        "auto": """
+    "auto": """
 **AUTO MODE**: Use your judgment to decide when narration adds value:
 - Always narrate completed coding work
 - Narrate complex explanations that benefit from audio
 - Skip simple yes/no answers or quick clarifications
 - Skip when user is actively reading code on screen
 """
-    }
+}
 
-    guidance = verbosity_guidance.get(verbosity, verbosity_guidance["medium"])
-    mode_instructions = mode_guidance.get(mode, mode_guidance["auto"])
+
+def _build_prompt(verbosity: str, mode: str) -> str:
+    """Assemble the narration prompt for one verbosity/mode pair."""
+    guidance = _VERBOSITY_GUIDANCE.get(verbosity, _VERBOSITY_GUIDANCE["medium"])
+    mode_instructions = _MODE_GUIDANCE.get(mode, _MODE_GUIDANCE["auto"])
 
     return f"{NARRATION_SYSTEM_PROMPT}\n\n{mode_instructions}\n\nCurrent verbosity setting: {verbosity}\n{guidance}"
 
 
+# Every supported combination is built once at import
+_PROMPT_CACHE = {
+    (verbosity, mode): _build_prompt(verbosity, mode)
+    for verbosity in _VERBOSITY_GUIDANCE
+    for mode in _MODE_GUIDANCE
+}
+
+
+def get_narration_prompt(verbosity: str = "medium", mode: str = "auto") -> str:
+    """Get the system prompt for voice narration mode.
+
+    Args:
+        verbosity: Level of narration detail (brief, medium, detailed)
+        mode: When to narrate (coding_only, conversational, auto)
+
+    Returns:
+        System prompt string with narration instructions
+    """
+    prompt = _PROMPT_CACHE.get((verbosity, mode))
+    if prompt is None:
+        # Unknown values fall back to the defaults but still echo the
+        # requested verbosity in the prompt
+        prompt = _build_prompt(verbosity, mode)
+    return prompt
+
+
 # Prompt for when user asks questions (no code changes)
 QUESTION_RESPONSE_PROMPT = """
 When the user asks a question that doesn't involve coding tasks, you can respond
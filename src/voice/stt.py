@@ -5,31 +5,122 @@ Supports:
 - Local Whisper models (fallback)
 """
 
+import io
+import logging
 import os
+import sys
 import tempfile
+import threading
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
-try:
-    from openai import OpenAI
-    OPENAI_AVAILABLE = True
-except ImportError:
-    OPENAI_AVAILABLE = False
+# Optional dependencies are imported on first use rather than at import
+# time: sounddevice initializes PortAudio and speech_recognition pulls in
+# audio backends, which OpenAI-only and server setups never need
+OpenAI = None
+sd = sf = np = None
+webrtcvad = None
+sr = None
+Foundation = Speech = None
 
-try:
-    import sounddevice as sd
-    import soundfile as sf
-    import numpy as np
-    AUDIO_RECORDING_AVAILABLE = True
-except ImportError:
-    AUDIO_RECORDING_AVAILABLE = False
 
-try:
-    import speech_recognition as sr
-    SPEECH_RECOGNITION_AVAILABLE = True
-except ImportError:
-    SPEECH_RECOGNITION_AVAILABLE = False
+def _load_openai() -> bool:
+    """Import the OpenAI client class, returning whether it is available."""
+    global OpenAI
+    if OpenAI is None:
+        try:
+            from openai import OpenAI
+        except ImportError:
+            return False
+    return True
+
+
+def _load_audio() -> bool:
+    """Import sounddevice, soundfile and numpy, returning whether they load."""
+    global sd, sf, np
+    if sd is None:
+        try:
+            import numpy
+            import soundfile
+            import sounddevice
+        except (ImportError, OSError):
+            # sounddevice raises OSError when the PortAudio library is missing
+            return False
+        sd, sf, np = sounddevice, soundfile, numpy
+    return True
+
+
+def _load_webrtcvad() -> bool:
+    """Import webrtcvad, returning whether it is available."""
+    global webrtcvad
+    if webrtcvad is None:
+        try:
+            import webrtcvad
+        except ImportError:
+            return False
+    return True
+
+
+def _load_speech_recognition() -> bool:
+    """Import speech_recognition, returning whether it is available."""
+    global sr
+    if sr is None:
+        try:
+            import speech_recognition as sr
+        except ImportError:
+            return False
+    return True
+
+
+def _load_macos_speech() -> bool:
+    """Import the PyObjC Foundation and Speech frameworks, if installed."""
+    global Foundation, Speech
+    if Speech is None:
+        try:
+            import Foundation
+            import Speech
+        except ImportError:
+            return False
+    return True
+
+
+logger = logging.getLogger(__name__)
+
+# Voice activity detection for open-ended recordings (webrtcvad)
+VAD_FRAME_MS = 30  # webrtcvad accepts 10, 20 or 30 ms frames
+VAD_AGGRESSIVENESS = 2  # 0 (lenient) to 3 (strict)
+END_OF_SPEECH_MS = 800  # Pause after speech that ends the recording
+CHUNK_SPLIT_SILENCE_MS = 300  # Pause that may close an upload chunk
+CHUNK_SECONDS = 10  # Minimum audio per chunk before it is uploaded early
+
+# Slack on top of a fixed duration before a silent input stream is an error
+RECORDING_TIMEOUT_MARGIN_S = 5.0
+
+# OpenAI clients by API key, so providers share one connection pool and
+# keep-alive TLS sessions instead of handshaking per provider
+_OPENAI_CLIENTS = {}
+_OPENAI_CLIENTS_LOCK = threading.Lock()
+
+# Local Whisper models by name; loading one takes seconds and hundreds of MB.
+# The lock is held across the load so the background preload and the first
+# listen() never load the same model twice.
+_LOCAL_MODEL_CACHE = {}
+_LOCAL_MODEL_LOCK = threading.Lock()
+
+
+def _status(message: str, verbose: bool) -> None:
+    """Show a recording status line, or only log it when not verbose.
+
+    Args:
+        message: Status text
+        verbose: Print to stdout (interactive use) instead of logging
+    """
+    if verbose:
+        print(message, flush=True)
+    else:
+        logger.debug(message)
 
 
 class STTProvider(ABC):
@@ -48,17 +139,21 @@ class STTProvider(ABC):
         pass
 
     @abstractmethod
-    def listen(self, duration: Optional[float] = None) -> str:
+    def listen(self, duration: Optional[float] = None, verbose: bool = True) -> str:
         """Record audio and transcribe to text.
 
         Args:
             duration: Recording duration in seconds (None = press Enter to stop)
+            verbose: Print recording status to stdout (False = log at DEBUG)
 
         Returns:
             Transcribed text
         """
         pass
 
+    def close(self) -> None:
+        """Release any audio device held open between recordings."""
+
 
 class OpenAIWhisper(STTProvider):
     """OpenAI Whisper STT provider using OpenAI API."""
@@ -76,17 +171,27 @@ class OpenAIWhisper(STTProvider):
             model: Whisper model to use
             language: Language code (e.g., 'en', 'es') or None for auto-detect
         """
-        if not OPENAI_AVAILABLE:
+        if not _load_openai():
             raise ImportError("openai package not installed. Run: pip install openai")
 
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
         if not self.api_key:
             raise ValueError("OpenAI API key required. Set OPENAI_API_KEY environment variable.")
 
-        self.client = OpenAI(api_key=self.api_key)
+        with _OPENAI_CLIENTS_LOCK:
+            self.client = _OPENAI_CLIENTS.get(self.api_key)
+            if self.client is None:
+                self.client = OpenAI(api_key=self.api_key)
+                _OPENAI_CLIENTS[self.api_key] = self.client
         self.model = model
         self.language = language
 
+        # One input stream is opened on the first listen() and reused until
+        # close(), so later recordings skip the PortAudio device open
+        self._stream = None
+        self._stream_lock = threading.Lock()
+        self._capture = None
+
     def transcribe(self, audio_path: Path) -> str:
         """Transcribe audio file using OpenAI Whisper.
 
@@ -100,81 +205,221 @@ class OpenAIWhisper(STTProvider):
             raise FileNotFoundError(f"Audio file not found: {audio_path}")
 
         with open(audio_path, "rb") as audio_file:
-            transcript = self.client.audio.transcriptions.create(
-                model=self.model,
-                file=audio_file,
-                language=self.language,
-            )
+            return self._transcribe_upload(audio_file)
+
+    def _transcribe_upload(self, upload) -> str:
+        """Send audio to the Whisper API.
+
+        Args:
+            upload: Open audio file or (filename, bytes) tuple
+
+        Returns:
+            Transcribed text
+        """
+        transcript = self.client.audio.transcriptions.create(
+            model=self.model,
+            file=upload,
+            language=self.language,
+        )
 
         return transcript.text
 
-    def listen(self, duration: Optional[float] = None) -> str:
+    def _transcribe_audio(self, audio_data, sample_rate: int) -> str:
+        """Encode recorded samples and transcribe them.
+
+        Args:
+            audio_data: Recorded int16 samples
+            sample_rate: Sample rate of the recording
+
+        Returns:
+            Transcribed text
+        """
+        # Encode in memory as 16-bit FLAC, which compresses speech well
+        # below the size of the equivalent 16-bit WAV upload
+        encoded = io.BytesIO()
+        sf.write(encoded, audio_data, sample_rate, format="FLAC", subtype="PCM_16")
+        return self._transcribe_upload(("audio.flac", encoded.getvalue()))
+
+    def _on_audio(self, indata, frames, time, status) -> None:
+        """Stream callback: pass frames to the active recording, if any."""
+        capture = self._capture
+        if capture is not None:
+            capture(indata, frames)
+
+    def _open_stream(self, sample_rate: int, channels: int) -> None:
+        """Start the shared input stream unless it is already running.
+
+        Args:
+            sample_rate: Sample rate to record at
+            channels: Number of channels to record
+        """
+        with self._stream_lock:
+            if self._stream is None:
+                stream = sd.InputStream(
+                    samplerate=sample_rate,
+                    channels=channels,
+                    callback=self._on_audio,
+                    dtype=np.int16,
+                    blocksize=sample_rate * VAD_FRAME_MS // 1000,
+                )
+                stream.start()
+                self._stream = stream
+
+    def close(self) -> None:
+        """Stop and release the microphone stream, if one is open."""
+        with self._stream_lock:
+            stream, self._stream = self._stream, None
+        if stream is not None:
+            stream.stop()
+            stream.close()
+
+    def _record(
+        self, sample_rate: int, channels: int, verbose: bool, duration: Optional[float] = None
+    ) -> str:
+        """Record until Enter (or trailing silence) and transcribe as it goes.
+
+        With webrtcvad installed, recording also stops after a pause following
+        speech, and every ~10s of audio that ends in a pause is uploaded while
+        recording continues, so only the last chunk is left to transcribe.
+        The input stream stays open between calls; close() releases it.
+
+        Args:
+            sample_rate: Sample rate to record at
+            channels: Number of channels to record
+            verbose: Print recording status to stdout
+            duration: Stop after this many seconds instead
+
+        Returns:
+            Transcribed text
+        """
+        vad = webrtcvad.Vad(VAD_AGGRESSIVENESS) if _load_webrtcvad() else None
+        frame_size = sample_rate * VAD_FRAME_MS // 1000
+        stop_frames = END_OF_SPEECH_MS // VAD_FRAME_MS
+        split_frames = CHUNK_SPLIT_SILENCE_MS // VAD_FRAME_MS
+        chunk_samples = CHUNK_SECONDS * sample_rate
+        target = int(duration * sample_rate) if duration else None
+
+        # Frames are copied straight into one buffer that doubles as
+        # needed, instead of a list of per-callback copies
+        buffer = np.empty((target or sample_rate * 60, channels), dtype=np.int16)
+        filled = 0
+        chunk_start = 0
+        heard_speech = False
+        silent_frames = 0
+        lock = threading.Lock()
+        stopped = threading.Event()
+        executor = ThreadPoolExecutor(max_workers=2)
+        chunks = []
+
+        def capture(indata, frames):
+            nonlocal buffer, filled, chunk_start, heard_speech, silent_frames
+            with lock:
+                if stopped.is_set():
+                    return
+                end = filled + frames
+                if end > len(buffer):
+                    grown = np.empty((max(end, 2 * len(buffer)), channels), dtype=np.int16)
+                    grown[:filled] = buffer[:filled]
+                    buffer = grown
+                buffer[filled:end] = indata
+                filled = end
+
+                if target is not None:
+                    if filled >= target:
+                        filled = target
+                        stopped.set()
+                    return
+
+                if vad is None or frames != frame_size:
+                    return
+
+                if vad.is_speech(indata[:, 0].tobytes(), sample_rate):
+                    heard_speech = True
+                    silent_frames = 0
+                    return
+
+                silent_frames += 1
+                if heard_speech and silent_frames >= stop_frames:
+                    stopped.set()
+                elif silent_frames == split_frames and filled - chunk_start >= chunk_samples:
+                    # Upload finished audio now instead of after recording ends
+                    chunk = buffer[chunk_start:filled].copy()
+                    chunks.append(executor.submit(self._transcribe_audio, chunk, sample_rate))
+                    chunk_start = filled
+
+        try:
+            self._capture = capture
+            try:
+                self._open_stream(sample_rate, channels)
+                if target is None and vad is None:
+                    input()  # Wait for Enter key
+                    stopped.set()
+                elif target is None:
+                    # Either Enter or the end-of-speech pause stops recording;
+                    # only read Enter from a terminal, never from piped stdin
+                    if sys.stdin.isatty():
+                        threading.Thread(
+                            target=lambda: (input(), stopped.set()), daemon=True
+                        ).start()
+                if target is None:
+                    stopped.wait()
+                elif not stopped.wait(duration + RECORDING_TIMEOUT_MARGIN_S):
+                    # The callback stopped delivering audio (device error or
+                    # unplugged mic); drop the stream so the next call reopens it
+                    self.close()
+                    raise RuntimeError(
+                        f"Recording timed out: no audio from the input device "
+                        f"after {duration + RECORDING_TIMEOUT_MARGIN_S:g}s"
+                    )
+            finally:
+                self._capture = None
+
+            _status("✓ Recording complete", verbose)
+            _status("🔄 Transcribing...", verbose)
+            with lock:
+                stopped.set()
+                if filled > chunk_start:
+                    chunk = buffer[chunk_start:filled]
+                    chunks.append(executor.submit(self._transcribe_audio, chunk, sample_rate))
+
+            texts = (future.result().strip() for future in chunks)
+            return " ".join(text for text in texts if text)
+        finally:
+            executor.shutdown(wait=False)
+
+    def listen(self, duration: Optional[float] = None, verbose: bool = True) -> str:
         """Record audio and transcribe.
 
         Args:
             duration: Recording duration in seconds (None = press Enter to stop)
+            verbose: Print recording status to stdout (False = log at DEBUG)
 
         Returns:
             Transcribed text
         """
-        if not AUDIO_RECORDING_AVAILABLE:
+        if not _load_audio():
             raise ImportError(
                 "Audio recording not available. Install: pip install sounddevice soundfile numpy"
             )
 
-        # Recording parameters
+        # Recording parameters; int16 is the mic's native format and what
+        # the upload is encoded as, at half the bytes of float32
         sample_rate = 16000  # Whisper expects 16kHz
         channels = 1  # Mono
 
-        print("🎤 Recording... ", end="", flush=True)
-
         if duration:
             # Fixed duration recording
-            print(f"({duration}s)")
-            audio_data = sd.rec(
-                int(duration * sample_rate),
-                samplerate=sample_rate,
-                channels=channels,
-                dtype=np.float32
-            )
-            sd.wait()
+            _status(f"🎤 Recording... ({duration}s)", verbose)
+            text = self._record(sample_rate, channels, verbose, duration)
         else:
             # Press Enter to stop
-            print("(Press Enter to stop)")
-            recording = []
-
-            def callback(indata, frames, time, status):
-                recording.append(indata.copy())
-
-            with sd.InputStream(
-                samplerate=sample_rate,
-                channels=channels,
-                callback=callback,
-                dtype=np.float32
-            ):
-                input()  # Wait for Enter key
+            prompt = " (Press Enter to stop)" if sys.stdin.isatty() else ""
+            _status(f"🎤 Recording...{prompt}", verbose)
+            text = self._record(sample_rate, channels, verbose)
 
-            audio_data = np.concatenate(recording, axis=0)
+        _status(f"✓ Transcription: {text}", verbose)
 
-        print("✓ Recording complete")
-
-        # Save to temp file
-        fd, temp_path = tempfile.mkstemp(suffix=".wav")
-        os.close(fd)
-        temp_file = Path(temp_path)
-
-        try:
-            sf.write(str(temp_file), audio_data, sample_rate)
-
-            print("🔄 Transcribing...")
-            text = self.transcribe(temp_file)
-            print(f"✓ Transcription: {text}")
-
-            return text
-        finally:
-            # Clean up temp file
-            if temp_file.exists():
-                temp_file.unlink()
+        return text
 
 
 class LocalWhisper(STTProvider):
@@ -188,10 +433,19 @@ class LocalWhisper(STTProvider):
         """
         try:
             import whisper
-            self.model = whisper.load_model(model_name)
         except ImportError:
             raise ImportError("whisper not installed. Run: pip install openai-whisper")
 
+        # load_model() picks CUDA when available, so the name is enough
+        with _LOCAL_MODEL_LOCK:
+            model = _LOCAL_MODEL_CACHE.get(model_name)
+            if model is None:
+                model = whisper.load_model(model_name)
+                _LOCAL_MODEL_CACHE[model_name] = model
+        self.model = model
+        # Half precision is only supported (and faster) on GPU
+        self.fp16 = model.device.type == "cuda"
+
     def transcribe(self, audio_path: Path) -> str:
         """Transcribe audio file using local Whisper.
 
@@ -201,14 +455,15 @@ class LocalWhisper(STTProvider):
         Returns:
             Transcribed text
         """
-        result = self.model.transcribe(str(audio_path), fp16=False)
+        result = self.model.transcribe(str(audio_path), fp16=self.fp16)
         return result["text"]
 
-    def listen(self, duration: Optional[float] = None) -> str:
+    def listen(self, duration: Optional[float] = None, verbose: bool = True) -> str:
         """Record audio and transcribe.
 
         Args:
             duration: Recording duration in seconds (None = press Enter to stop)
+            verbose: Print recording status to stdout (False = log at DEBUG)
 
         Returns:
             Transcribed text
@@ -218,8 +473,37 @@ class LocalWhisper(STTProvider):
         raise NotImplementedError("Local Whisper listen() not yet implemented")
 
 
+def _macos_speech_authorized(timeout: float = 30.0) -> bool:
+    """Check (asking once if needed) that speech recognition is permitted.
+
+    Args:
+        timeout: Seconds to wait for the user to answer the permission prompt
+
+    Returns:
+        True if the Speech framework may be used
+    """
+    status = Speech.SFSpeechRecognizer.authorizationStatus()
+    if status == Speech.SFSpeechRecognizerAuthorizationStatusNotDetermined:
+        answered = threading.Event()
+        result = {}
+
+        def handler(new_status):
+            result["status"] = new_status
+            answered.set()
+
+        Speech.SFSpeechRecognizer.requestAuthorization_(handler)
+        answered.wait(timeout)
+        status = result.get("status", status)
+
+    return status == Speech.SFSpeechRecognizerAuthorizationStatusAuthorized
+
+
 class MacOSSTT(STTProvider):
-    """macOS native STT provider using built-in speech recognition."""
+    """macOS native STT provider.
+
+    Transcribes with Apple's on-device Speech framework (via PyObjC) when it
+    is installed and permitted, falling back to CMU Sphinx otherwise.
+    """
 
     def __init__(self, language: str = "en-US"):
         """Initialize macOS STT provider.
@@ -227,11 +511,100 @@ class MacOSSTT(STTProvider):
         Args:
             language: Language code (e.g., 'en-US', 'es-ES')
         """
-        if not SPEECH_RECOGNITION_AVAILABLE:
-            raise ImportError("speech_recognition not installed. Run: pip install SpeechRecognition")
+        has_sphinx = _load_speech_recognition()
+        if not has_sphinx and not _load_macos_speech():
+            raise ImportError(
+                "No macOS speech recognition available. Run: "
+                "pip install pyobjc-framework-Speech (or SpeechRecognition pocketsphinx)"
+            )
 
-        self.recognizer = sr.Recognizer()
+        self.recognizer = sr.Recognizer() if has_sphinx else None
         self.language = language
+        self._native = self._create_native_recognizer(language)
+        if self._native is None and self.recognizer is None:
+            raise RuntimeError(
+                "On-device speech recognition is unavailable or not permitted. "
+                "Run: pip install SpeechRecognition pocketsphinx"
+            )
+
+    @staticmethod
+    def _create_native_recognizer(language: str):
+        """Create an on-device SFSpeechRecognizer, or None if unusable."""
+        if not _load_macos_speech():
+            return None
+
+        locale = Foundation.NSLocale.alloc().initWithLocaleIdentifier_(language)
+        recognizer = Speech.SFSpeechRecognizer.alloc().initWithLocale_(locale)
+        if recognizer is None or not recognizer.supportsOnDeviceRecognition():
+            return None
+        if not _macos_speech_authorized():
+            return None
+
+        # Deliver results on a background queue; we don't run a main run loop
+        recognizer.setQueue_(Foundation.NSOperationQueue.alloc().init())
+        return recognizer
+
+    def _transcribe_native(self, audio_path: Path, timeout: float = 60.0) -> str:
+        """Transcribe an audio file with the on-device Speech framework.
+
+        Args:
+            audio_path: Path to audio file
+            timeout: Seconds to wait for the final result
+
+        Returns:
+            Transcribed text
+        """
+        url = Foundation.NSURL.fileURLWithPath_(str(audio_path))
+        request = Speech.SFSpeechURLRecognitionRequest.alloc().initWithURL_(url)
+        request.setRequiresOnDeviceRecognition_(True)
+
+        done = threading.Event()
+        outcome = {}
+
+        def handler(result, error):
+            if error is not None:
+                outcome["error"] = error.localizedDescription()
+                done.set()
+            elif result is not None and result.isFinal():
+                outcome["text"] = result.bestTranscription().formattedString()
+                done.set()
+
+        self._native.recognitionTaskWithRequest_resultHandler_(request, handler)
+
+        if not done.wait(timeout):
+            raise RuntimeError("Speech recognition timed out")
+        if "error" in outcome:
+            raise RuntimeError(f"Speech recognition error: {outcome['error']}")
+        if not outcome["text"]:
+            raise ValueError("Could not understand audio")
+        return outcome["text"]
+
+    def _recognize(self, audio) -> str:
+        """Transcribe recorded speech_recognition AudioData.
+
+        Args:
+            audio: AudioData from the microphone
+
+        Returns:
+            Transcribed text
+        """
+        if self._native is not None:
+            # The Speech framework reads from a file URL
+            fd, temp_path = tempfile.mkstemp(suffix=".wav")
+            with os.fdopen(fd, "wb") as f:
+                f.write(audio.get_wav_data())
+            try:
+                return self._transcribe_native(Path(temp_path))
+            finally:
+                os.unlink(temp_path)
+
+        try:
+            # Use CMU Sphinx recognition (offline, free)
+            return self.recognizer.recognize_sphinx(audio)
+        except sr.UnknownValueError:
+            raise ValueError("Could not understand audio")
+        except sr.RequestError as e:
+            raise RuntimeError(f"Speech recognition error: {e}")
 
     def transcribe(self, audio_path: Path) -> str:
         """Transcribe audio file using macOS speech recognition.
@@ -245,50 +618,44 @@ class MacOSSTT(STTProvider):
         if not audio_path.exists():
             raise FileNotFoundError(f"Audio file not found: {audio_path}")
 
+        if self._native is not None:
+            return self._transcribe_native(audio_path)
+
         with sr.AudioFile(str(audio_path)) as source:
             audio = self.recognizer.record(source)
-            try:
-                # Use macOS built-in recognition (offline, free)
-                text = self.recognizer.recognize_sphinx(audio)
-                return text
-            except sr.UnknownValueError:
-                raise ValueError("Could not understand audio")
-            except sr.RequestError as e:
-                raise RuntimeError(f"Speech recognition error: {e}")
-
-    def listen(self, duration: Optional[float] = None) -> str:
+        return self._recognize(audio)
+
+    def listen(self, duration: Optional[float] = None, verbose: bool = True) -> str:
         """Record audio and transcribe using macOS microphone.
 
         Args:
             duration: Recording duration in seconds (None = auto-detect silence)
+            verbose: Print recording status to stdout (False = log at DEBUG)
 
         Returns:
             Transcribed text
         """
-        print("🎤 Listening... ", end="", flush=True)
+        if self.recognizer is None:
+            raise ImportError(
+                "Microphone recording requires SpeechRecognition. Run: pip install SpeechRecognition"
+            )
 
         with sr.Microphone() as source:
             # Adjust for ambient noise
             self.recognizer.adjust_for_ambient_noise(source, duration=0.5)
 
             if duration:
-                print(f"({duration}s)")
+                _status(f"🎤 Listening... ({duration}s)", verbose)
                 audio = self.recognizer.record(source, duration=duration)
             else:
-                print("(speak now)")
+                _status("🎤 Listening... (speak now)", verbose)
                 audio = self.recognizer.listen(source)
 
-        print("✓ Processing...")
+        _status("✓ Processing...", verbose)
 
-        try:
-            # Use macOS built-in recognition (offline, free)
-            text = self.recognizer.recognize_sphinx(audio)
-            print(f"✓ Transcription: {text}")
-            return text
-        except sr.UnknownValueError:
-            raise ValueError("Could not understand audio")
-        except sr.RequestError as e:
-            raise RuntimeError(f"Speech recognition error: {e}")
+        text = self._recognize(audio)
+        _status(f"✓ Transcription: {text}", verbose)
+        return text
 
 
 def get_stt_provider(
@@ -322,12 +689,14 @@ def get_stt_provider(
 def listen(
     duration: Optional[float] = None,
     provider: Optional[str] = None,
+    verbose: bool = True,
 ) -> str:
     """Convenience function to record and transcribe using configured provider.
 
     Args:
         duration: Recording duration in seconds (None = press Enter to stop)
         provider: Provider name (defaults to STT_PROVIDER env var or 'openai')
+        verbose: Print recording status to stdout (False = log at DEBUG)
 
     Returns:
         Transcribed text
@@ -336,7 +705,28 @@ def listen(
     model = os.getenv("STT_MODEL", "whisper-1")
 
     stt = get_stt_provider(provider=provider, model=model)
-    return stt.listen(duration=duration)
+    try:
+        return stt.listen(duration=duration, verbose=verbose)
+    finally:
+        # One-shot provider; a caller looping over recordings should keep
+        # its own provider so the microphone stream is reused
+        stt.close()
+
+
+def preload_listen(provider: Optional[str] = None) -> None:
+    """Load what listen() needs ahead of time, so its first call is quicker.
+
+    This imports the audio libraries, creates the shared OpenAI client or
+    loads the local Whisper model, depending on the provider.
+
+    Args:
+        provider: Provider name (defaults to STT_PROVIDER env var or 'openai')
+    """
+    provider = provider or os.getenv("STT_PROVIDER", "openai")
+    model = os.getenv("STT_MODEL", "whisper-1")
+
+    _load_audio()
+    get_stt_provider(provider=provider, model=model).close()
 
 
 # Example usage
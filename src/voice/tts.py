@@ -6,11 +6,19 @@ Supports:
 - Local TTS engines (offline, free)
 """
 
+import functools
+import hashlib
 import os
+import re
 import tempfile
+import threading
+import time
+import unicodedata
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional, Tuple
 
 try:
     from openai import OpenAI
@@ -25,12 +33,253 @@ try:
 except ImportError:
     ELEVENLABS_AVAILABLE = False
 
-try:
-    import sounddevice as sd
-    import soundfile as sf
-    AUDIO_PLAYBACK_AVAILABLE = True
-except ImportError:
-    AUDIO_PLAYBACK_AVAILABLE = False
+# sounddevice initializes PortAudio on import, so the playback libraries
+# are only imported once audio is actually played
+sd = sf = None
+
+
+def _load_audio() -> bool:
+    """Import sounddevice and soundfile, returning whether they load."""
+    global sd, sf
+    if sd is None:
+        try:
+            import soundfile
+            import sounddevice
+        except (ImportError, OSError):
+            # sounddevice raises OSError when the PortAudio library is missing
+            return False
+        sd, sf = sounddevice, soundfile
+    return True
+
+
+def _require_audio() -> None:
+    """Load the playback libraries or raise ImportError."""
+    if not _load_audio():
+        raise ImportError(
+            "Audio playback not available. Install: pip install sounddevice soundfile"
+        )
+
+
+# Oldest cached narrations are evicted past this many files
+TTS_CACHE_MAX_FILES = 200
+
+# Streaming providers are asked for raw 16-bit mono PCM at this rate, which
+# can be played as it arrives with no decoder in between
+PCM_SAMPLE_RATE = 24000
+
+# Narrations are synthesized a sentence at a time, this many in parallel
+TTS_PREFETCH_WORKERS = 4
+_SENTENCE_BREAK = re.compile(r"(?<=[.!?])\s+")
+
+# Output stream held open between narrations by open_playback()
+_playback_stream = None
+
+
+def _tts_cache_dir() -> Optional[Path]:
+    """Get the synthesized-audio cache directory.
+
+    Returns:
+        Cache directory, or None when TTS_CACHE=false
+    """
+    if os.getenv("TTS_CACHE", "true").lower() == "false":
+        return None
+    default_dir = Path.home() / ".cache" / "talk-to-me" / "tts"
+    return Path(os.getenv("TTS_CACHE_DIR", str(default_dir))).expanduser()
+
+
+def _pcm_frames(chunks: Iterator[bytes]) -> Iterator[bytes]:
+    """Re-split 16-bit PCM chunks so none ends partway through a sample.
+
+    Args:
+        chunks: PCM bytes split anywhere
+
+    Yields:
+        Chunks of whole 16-bit samples
+    """
+    pending = b""
+    for chunk in chunks:
+        # Chunks can end mid-sample; carry the odd byte to the next one
+        data = pending + chunk if pending else chunk
+        usable = len(data) & ~1
+        pending = data[usable:]
+        if usable:
+            yield data[:usable]
+
+
+@contextmanager
+def _output_stream():
+    """Get a PCM output stream for one narration.
+
+    Uses the stream left open by open_playback() when there is one, and
+    otherwise opens a stream for just this narration. Either way, leaving
+    the block waits until the written audio has been played.
+    """
+    if _playback_stream is not None:
+        yield _playback_stream
+        # The warm stream keeps running, so wait out what is still buffered
+        time.sleep(_playback_stream.latency)
+        return
+
+    # Leaving the block stops the stream, which drains queued audio first
+    with sd.RawOutputStream(samplerate=PCM_SAMPLE_RATE, channels=1, dtype="int16") as stream:
+        yield stream
+
+
+def open_playback() -> None:
+    """Open the audio output device now and keep it open for speak().
+
+    The device then starts once, up front, rather than at the start of
+    every narration; it plays silence between narrations. Call
+    close_playback() when done.
+    """
+    global _playback_stream
+    if _playback_stream is None:
+        _require_audio()
+        stream = sd.RawOutputStream(samplerate=PCM_SAMPLE_RATE, channels=1, dtype="int16")
+        stream.start()
+        _playback_stream = stream
+
+
+def close_playback() -> None:
+    """Close the output stream opened by open_playback(), if any."""
+    global _playback_stream
+    stream, _playback_stream = _playback_stream, None
+    if stream is not None:
+        stream.stop()
+        stream.close()
+
+
+def _prune_tts_cache(cache_dir: Path) -> None:
+    """Evict the least recently played files beyond TTS_CACHE_MAX_FILES.
+
+    .mp3 entries from the earlier cache format are never read again, so
+    they are always removed.
+    """
+    entries = []
+    for path in cache_dir.iterdir():
+        if path.suffix == ".flac":
+            entries.append(path)
+        elif path.suffix == ".mp3":
+            path.unlink(missing_ok=True)
+    entries.sort(key=lambda p: p.stat().st_mtime)
+    for old_path in entries[:-TTS_CACHE_MAX_FILES]:
+        old_path.unlink(missing_ok=True)
+
+
+def _sentence_pcm(
+    provider: "TTSProvider",
+    sentence: str,
+    audio_path: Optional[Path],
+    stream=None,
+) -> Tuple[bytes, bool]:
+    """Get one sentence's PCM from the cache or the provider.
+
+    Args:
+        provider: Provider whose stream_pcm() yields the audio
+        sentence: Text to synthesize
+        audio_path: Cache file for this sentence, or None when caching is off
+        stream: Output stream to play the audio on as it arrives, if any
+
+    Returns:
+        Tuple of (PCM not already written to stream, whether it was cached)
+    """
+    if audio_path is not None:
+        try:
+            # Touch so eviction keeps recently played narrations; this is also
+            # the hit check, so a file pruned by another process counts as a miss
+            os.utime(audio_path)
+        except FileNotFoundError:
+            pass
+        else:
+            pcm = sf.read(str(audio_path), dtype="int16")[0].tobytes()
+            if stream is not None:
+                stream.write(pcm)
+                return b"", True
+            return pcm, True
+
+    collected = bytearray()
+    cache_file = temp_path = None
+    try:
+        if audio_path is not None:
+            # Several sentences may be fetched at once, so the temp name
+            # is unique per thread as well as per process
+            temp_path = audio_path.with_name(
+                f"{audio_path.stem}.{os.getpid()}.{threading.get_ident()}.tmp"
+            )
+            cache_file = sf.SoundFile(
+                str(temp_path), "w",
+                samplerate=PCM_SAMPLE_RATE,
+                channels=1,
+                subtype="PCM_16",
+                format="FLAC",
+            )
+        for frames in _pcm_frames(provider.stream_pcm(sentence)):
+            if stream is not None:
+                stream.write(frames)
+            else:
+                collected += frames
+            if cache_file is not None:
+                cache_file.buffer_write(frames, dtype="int16")
+        if cache_file is not None:
+            cache_file.close()
+            os.replace(temp_path, audio_path)
+    finally:
+        if cache_file is not None:
+            cache_file.close()
+            temp_path.unlink(missing_ok=True)
+
+    return bytes(collected), False
+
+
+def _speak_with_cache(provider: "TTSProvider", text: str, cache_key: str) -> None:
+    """Play text, reusing previously synthesized audio when available.
+
+    Narrations repeat often ("Done", greetings), and every hook run is a new
+    process, so audio is cached on disk rather than in memory. Each sentence
+    is synthesized and cached on its own: the first plays as it streams in
+    while the rest are fetched in parallel, then they play in order.
+
+    Args:
+        provider: Provider whose stream_pcm() yields the audio
+        text: Text to speak
+        cache_key: Provider settings that affect the audio (model, voice, ...)
+    """
+    cache_dir = _tts_cache_dir()
+    if cache_dir is not None:
+        try:
+            # Cached audio is speech of conversation content; owner-only
+            cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+        except OSError:
+            cache_dir = None
+
+    # Narrations arrive wrapped across lines; collapsing whitespace lets the
+    # same words hit the same cache entry however they were laid out
+    sentences = _SENTENCE_BREAK.split(" ".join(text.split()))
+    if cache_dir is None:
+        audio_paths = [None] * len(sentences)
+    else:
+        audio_paths = []
+        for sentence in sentences:
+            # NFKC folds compatibility forms (full-width letters, ligatures)
+            # that are spoken the same into one cache entry
+            key_text = unicodedata.normalize("NFKC", sentence)
+            digest = hashlib.sha256(f"{cache_key}\0{key_text}".encode("utf-8")).hexdigest()
+            audio_paths.append(cache_dir / f"{digest}.flac")
+
+    with ThreadPoolExecutor(max_workers=TTS_PREFETCH_WORKERS) as executor:
+        later = [
+            executor.submit(_sentence_pcm, provider, sentence, audio_path)
+            for sentence, audio_path in zip(sentences[1:], audio_paths[1:])
+        ]
+        with _output_stream() as stream:
+            _, all_cached = _sentence_pcm(provider, sentences[0], audio_paths[0], stream)
+            for future in later:
+                pcm, cached = future.result()
+                stream.write(pcm)
+                all_cached = all_cached and cached
+
+    if cache_dir is not None and not all_cached:
+        _prune_tts_cache(cache_dir)
 
 
 class TTSProvider(ABC):
@@ -120,29 +369,37 @@ class OpenAITTS(TTSProvider):
 
         return output_path
 
+    def stream_pcm(self, text: str) -> Iterator[bytes]:
+        """Synthesize text, yielding raw PCM as the API produces it.
+
+        Args:
+            text: Text to synthesize
+
+        Yields:
+            16-bit mono PCM chunks at PCM_SAMPLE_RATE
+        """
+        if not text or not text.strip():
+            raise ValueError("Text cannot be empty")
+
+        with self.client.audio.speech.with_streaming_response.create(
+            model=self.model,
+            voice=self.voice,
+            input=text,
+            speed=self.speed,
+            response_format="pcm",
+        ) as response:
+            yield from response.iter_bytes()
+
     def speak(self, text: str) -> None:
         """Synthesize and play audio.
 
         Args:
             text: Text to speak
         """
-        if not AUDIO_PLAYBACK_AVAILABLE:
-            raise ImportError(
-                "Audio playback not available. Install: pip install sounddevice soundfile"
-            )
+        _require_audio()
 
-        # Generate audio
-        audio_path = self.synthesize(text)
-
-        try:
-            # Play audio
-            data, samplerate = sf.read(str(audio_path))
-            sd.play(data, samplerate)
-            sd.wait()  # Wait until audio finishes playing
-        finally:
-            # Clean up temp file
-            if audio_path.exists():
-                audio_path.unlink()
+        cache_key = f"openai:{self.model}:{self.voice}:{self.speed}"
+        _speak_with_cache(self, text, cache_key)
 
 
 class LocalTTS(TTSProvider):
@@ -238,11 +495,8 @@ class ElevenLabsTTS(TTSProvider):
 
         self.client = ElevenLabs(api_key=self.api_key)
 
-        # Resolve voice name to ID if needed
-        if voice.lower() in self.VOICES:
-            self.voice_id = self.VOICES[voice.lower()]
-        else:
-            self.voice_id = voice  # Assume it's already a voice ID
+        # Resolve voice name to ID; anything else is assumed to be a voice ID
+        self.voice_id = self.VOICES.get(voice.lower(), voice)
 
         self.model = model
         self.stability = stability
@@ -285,29 +539,42 @@ class ElevenLabsTTS(TTSProvider):
 
         return output_path
 
+    def stream_pcm(self, text: str) -> Iterator[bytes]:
+        """Synthesize text, yielding raw PCM as the API produces it.
+
+        Args:
+            text: Text to synthesize
+
+        Yields:
+            16-bit mono PCM chunks at PCM_SAMPLE_RATE
+        """
+        if not text or not text.strip():
+            raise ValueError("Text cannot be empty")
+
+        yield from self.client.text_to_speech.stream(
+            voice_id=self.voice_id,
+            text=text,
+            model_id=self.model,
+            output_format=f"pcm_{PCM_SAMPLE_RATE}",
+            voice_settings={
+                "stability": self.stability,
+                "similarity_boost": self.similarity_boost,
+            }
+        )
+
     def speak(self, text: str) -> None:
         """Synthesize and play audio.
 
         Args:
             text: Text to speak
         """
-        if not AUDIO_PLAYBACK_AVAILABLE:
-            raise ImportError(
-                "Audio playback not available. Install: pip install sounddevice soundfile"
-            )
-
-        # Generate audio
-        audio_path = self.synthesize(text)
+        _require_audio()
 
-        try:
-            # Play audio
-            data, samplerate = sf.read(str(audio_path))
-            sd.play(data, samplerate)
-            sd.wait()  # Wait until audio finishes playing
-        finally:
-            # Clean up temp file
-            if audio_path.exists():
-                audio_path.unlink()
+        cache_key = (
+            f"elevenlabs:{self.model}:{self.voice_id}:"
+            f"{self.stability}:{self.similarity_boost}"
+        )
+        _speak_with_cache(self, text, cache_key)
 
 
 def get_tts_provider(
@@ -346,6 +613,24 @@ def get_tts_provider(
         raise ValueError(f"Unknown TTS provider: {provider}. Choose: elevenlabs, openai, or local")
 
 
+@functools.lru_cache(maxsize=8)
+def _get_shared_tts_provider(provider: str, speed: float) -> TTSProvider:
+    """Get a TTS provider that is reused across speak() calls.
+
+    Long-lived callers (the hook worker, the wrapper loop) speak many
+    narrations, and each new provider would open a fresh HTTP client and
+    pay the TLS handshake again.
+
+    Args:
+        provider: Provider name (elevenlabs, openai, local)
+        speed: Speech speed
+
+    Returns:
+        TTSProvider instance
+    """
+    return get_tts_provider(provider=provider, speed=speed)
+
+
 def speak(text: str, provider: Optional[str] = None) -> None:
     """Convenience function to speak text using configured provider.
 
@@ -360,10 +645,23 @@ def speak(text: str, provider: Optional[str] = None) -> None:
     speed = float(os.getenv("TTS_SPEED", "1.0"))
 
     # Voice is auto-selected based on provider in get_tts_provider()
-    tts = get_tts_provider(provider=provider, speed=speed)
+    tts = _get_shared_tts_provider(provider, speed)
     tts.speak(text)
 
 
+def preload_speak(provider: Optional[str] = None) -> None:
+    """Build the provider speak() will use, so its first call skips setup.
+
+    Args:
+        provider: Provider name (defaults to TTS_PROVIDER env var or 'openai')
+    """
+    provider = provider or os.getenv("TTS_PROVIDER", "openai")
+    speed = float(os.getenv("TTS_SPEED", "1.0"))
+
+    _load_audio()
+    _get_shared_tts_provider(provider, speed)
+
+
 # Example usage
 if __name__ == "__main__":
     sample_text = """
@@ -7,6 +7,9 @@ to Claude Code CLI interactions.
 import os
 import sys
 import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
@@ -14,12 +17,20 @@ from dotenv import load_dotenv
 
 from .prompt import get_narration_prompt
 from .extractor import split_output, extract_narration
-from .voice import speak, listen
+from .voice import speak
+from .voice.tts import open_playback, close_playback, preload_speak
+from .voice.stt import get_stt_provider, preload_listen
 
 
 # Load environment variables
 load_dotenv()
 
+# Rule printed above and below Claude's output
+_RULE = "=" * 60
+
+# Speaks narrations while the caller prints; one worker keeps them in order
+_speech_executor = ThreadPoolExecutor(max_workers=1)
+
 
 def print_banner():
     """Print welcome banner."""
@@ -56,40 +67,77 @@ def check_dependencies():
     return True
 
 
-def process_claude_output(output: str, verbosity: str = "medium", provider: Optional[str] = None) -> None:
+@dataclass(frozen=True, slots=True)
+class _NarrationConfig:
+    """Narration switches from the environment, read once per session."""
+
+    narration_enabled: bool
+    auto_speak: bool
+
+    @classmethod
+    def from_env(cls) -> "_NarrationConfig":
+        """Read the NARRATION_ENABLED and AUTO_SPEAK settings."""
+        return cls(
+            narration_enabled=os.getenv("NARRATION_ENABLED", "true").lower() == "true",
+            auto_speak=os.getenv("AUTO_SPEAK", "true").lower() == "true",
+        )
+
+
+def process_claude_output(
+    output: str,
+    verbosity: str = "medium",
+    provider: Optional[str] = None,
+    config: Optional[_NarrationConfig] = None,
+) -> None:
     """Process Claude's output and handle voice narration.
 
     Args:
         output: Claude's response text
         verbosity: Narration verbosity level
         provider: TTS provider override (elevenlabs, openai, local)
+        config: Narration settings (None = read from the environment)
     """
     # Split into terminal and voice components
     terminal_text, narration = split_output(output)
 
-    # Display terminal output
+    if config is None:
+        config = _NarrationConfig.from_env()
+    narration_enabled = config.narration_enabled
+    auto_speak = config.auto_speak
+
+    # Start speaking before printing, so synthesis overlaps the terminal output
+    speech = None
+    if narration and narration_enabled and auto_speak:
+        speech = _speech_executor.submit(speak, narration, provider=provider)
+
+    # Display terminal output, in one write rather than one per line
     if terminal_text:
-        print("\n" + "="*60)
-        print(terminal_text)
-        print("="*60 + "\n")
+        print(f"\n{_RULE}\n{terminal_text}\n{_RULE}\n", flush=True)
 
     # Speak narration if available
     if narration:
-        narration_enabled = os.getenv("NARRATION_ENABLED", "true").lower() == "true"
-        auto_speak = os.getenv("AUTO_SPEAK", "true").lower() == "true"
-
         if narration_enabled:
             print(f"🔊 Narration: {narration}\n")
 
-            if auto_speak:
+            if speech is not None:
                 try:
-                    speak(narration, provider=provider)
+                    speech.result()
                 except Exception as e:
                     print(f"⚠️  TTS failed: {e}")
             else:
                 print("💡 Tip: Set AUTO_SPEAK=true in .env to enable automatic voice")
 
 
+def _preload_voice() -> None:
+    """Set up the TTS and STT providers before they are first used."""
+    for preload in (preload_listen, preload_speak):
+        try:
+            preload()
+        except Exception:
+            # The same error is reported when the provider is really used
+            pass
+
+
 def interactive_mode():
     """Run in interactive mode with voice input."""
     print_banner()
@@ -99,14 +147,28 @@ def interactive_mode():
     if not check_dependencies():
         sys.exit(1)
 
+    # Start the output device now so the first narration doesn't wait on it
+    try:
+        open_playback()
+    except Exception as e:
+        print(f"⚠️  Could not open audio output: {e}")
+
+    # Clients and models load while the user reads the banner
+    threading.Thread(target=_preload_voice, daemon=True).start()
+
     verbosity = os.getenv("NARRATION_VERBOSITY", "medium")
     prompt_instruction = get_narration_prompt(verbosity)
+    config = _NarrationConfig.from_env()
 
     print("\n📋 System Prompt Loaded:")
     print(f"   Verbosity: {verbosity}")
-    print(f"   Narration: {'enabled' if os.getenv('NARRATION_ENABLED', 'true') == 'true' else 'disabled'}")
+    print(f"   Narration: {'enabled' if config.narration_enabled else 'disabled'}")
     print()
 
+    # One provider for the whole loop, so its microphone stream stays open
+    # between recordings instead of being reopened for every turn
+    stt = None
+
     try:
         while True:
             print("\n" + "-"*60)
@@ -114,7 +176,12 @@ def interactive_mode():
 
             try:
                 # Listen for voice input
-                user_input = listen()
+                if stt is None:
+                    stt = get_stt_provider(
+                        provider=os.getenv("STT_PROVIDER", "openai"),
+                        model=os.getenv("STT_MODEL", "whisper-1"),
+                    )
+                user_input = stt.listen()
 
                 if not user_input or user_input.strip().lower() in ["exit", "quit", "bye"]:
                     print("\n👋 Goodbye!")
@@ -141,7 +208,7 @@ summarize actual code changes made by Claude.
 [Detailed code changes would appear here in production]
 """
 
-                process_claude_output(sample_response, verbosity)
+                process_claude_output(sample_response, verbosity, config=config)
 
             except KeyboardInterrupt:
                 print("\n\n👋 Interrupted. Goodbye!")
@@ -153,6 +220,10 @@ summarize actual code changes made by Claude.
     except Exception as e:
         print(f"\n❌ Fatal error: {e}")
         sys.exit(1)
+    finally:
+        if stt is not None:
+            stt.close()
+        close_playback()
 
 
 def text_mode(input_text: str, provider: Optional[str] = None):
@@ -0,0 +1,29 @@
+"""Shared test fixtures."""
+
+import pytest
+from unittest.mock import Mock
+
+from src.mcp_server import voice_controller
+
+
+@pytest.fixture(autouse=True, scope="session")
+def voice_dry_run():
+    """Keep narrations silent unless a test asks for live_speech."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("VOICE_DRY_RUN", "true")
+        yield
+
+
+@pytest.fixture
+def live_speech(monkeypatch):
+    """Let speak_async reach the TTS worker or the in-process fallback."""
+    monkeypatch.delenv("VOICE_DRY_RUN")
+
+
+@pytest.fixture
+def mock_popen(live_speech, monkeypatch):
+    """Speak through a stubbed background TTS worker."""
+    popen = Mock()
+    monkeypatch.setattr(voice_controller.subprocess, "Popen", popen)
+    monkeypatch.setattr(voice_controller, "_worker", None)
+    return popen
@@ -1,7 +1,6 @@
 """End-to-end tests for conversation flow with voice."""
 
 import pytest
-from unittest.mock import patch, Mock
 
 from src.mcp_server.session import SessionManager
 from src.mcp_server.voice_controller import VoiceController
@@ -11,7 +10,6 @@ from src.mcp_server.tools import ToolHandler
 class TestE2EConversation:
     """End-to-end conversation flow tests."""
 
-    @pytest.mark.asyncio
     async def test_multi_turn_conversation(self):
         """Test multi-turn conversation with context persistence."""
         manager = SessionManager()
@@ -57,8 +55,6 @@ class TestE2EConversation:
         assert session.history[2].role == "user"
         assert session.history[3].role == "assistant"
 
-    @pytest.mark.asyncio
-    @patch('src.mcp_server.voice_controller.subprocess.Popen')
     async def test_conversation_with_voice_narration(self, mock_popen):
         """Test conversation with voice narration extraction and TTS."""
         manager = SessionManager()
@@ -94,7 +90,6 @@ class TestE2EConversation:
         # Verify TTS was called (background process)
         mock_popen.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_voice_settings_change_mid_conversation(self):
         """Test changing voice settings during conversation."""
         manager = SessionManager()
@@ -131,7 +126,6 @@ class TestE2EConversation:
         # Verify both messages are in history
         assert len(session.history) == 2
 
-    @pytest.mark.asyncio
     async def test_conversation_history_retrieval_at_different_points(self):
         """Test retrieving history at different conversation points."""
         manager = SessionManager()
@@ -160,7 +154,6 @@ class TestE2EConversation:
         assert "Message 2" in text
         assert "Message 3" in text
 
-    @pytest.mark.asyncio
     async def test_clear_and_restart_conversation(self):
         """Test clearing conversation and starting fresh."""
         manager = SessionManager()
@@ -185,9 +178,7 @@ class TestE2EConversation:
         assert session.history[0].content == "Second conversation, message 1"
         assert session.session_id == first_session_id  # Same session
 
-    @pytest.mark.asyncio
-    @patch('src.mcp_server.voice_controller.subprocess.Popen')
-    async def test_narration_verbosity_affects_output(self, mock_popen):
+    async def test_narration_verbosity_affects_output(self):
         """Test that verbosity setting affects narration."""
         manager = SessionManager()
         handler = ToolHandler(manager)
@@ -202,7 +193,6 @@ class TestE2EConversation:
         await handler.set_voice_settings({"verbosity": "detailed"})
         assert session.voice_settings["verbosity"] == "detailed"
 
-    @pytest.mark.asyncio
     async def test_session_persistence_across_operations(self):
         """Test that session persists across different operations."""
         manager = SessionManager()
@@ -224,8 +214,6 @@ class TestE2EConversation:
         assert len(current_session.history) == 2
         assert current_session.voice_settings["auto_speak"] is False
 
-    @pytest.mark.asyncio
-    @patch('src.mcp_server.voice_controller.subprocess.Popen')
     async def test_voice_controller_integration(self, mock_popen):
         """Test VoiceController integration with session."""
         session = SessionManager().get_current_session()
@@ -242,7 +230,6 @@ class TestE2EConversation:
         # Verify TTS was triggered
         mock_popen.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_empty_message_handling(self):
         """Test handling of edge cases like empty messages."""
         manager = SessionManager()
@@ -259,9 +246,7 @@ class TestE2EConversation:
         assert session.history[0].content == ""
         assert session.history[1].content == "   "
 
-    @pytest.mark.asyncio
-    @patch('src.mcp_server.voice_controller.subprocess.Popen')
-    async def test_narration_extraction_with_multiple_tags(self, mock_popen):
+    async def test_narration_extraction_with_multiple_tags(self):
         """Test narration extraction when multiple tags present."""
         manager = SessionManager()
         handler = ToolHandler(manager)
@@ -49,7 +49,6 @@ class TestMCPServerSetup:
         assert "conversation://history" in resource_uris
         assert "conversation://settings" in resource_uris
 
-    @pytest.mark.asyncio
     async def test_tool_handler_integration(self):
         """Test ToolHandler with SessionManager integration."""
         manager = SessionManager()
@@ -69,7 +68,6 @@ class TestMCPServerSetup:
         assert len(session.history) == 1
         assert session.history[0].content == "Integration test message"
 
-    @pytest.mark.asyncio
     async def test_resource_handler_integration(self):
         """Test ResourceHandler with SessionManager integration."""
         manager = SessionManager()
@@ -86,7 +84,6 @@ class TestMCPServerSetup:
         assert "session_id" in result
         assert "Test message" in result
 
-    @pytest.mark.asyncio
     async def test_full_conversation_integration(self):
         """Test a complete conversation flow through handlers."""
         manager = SessionManager()
@@ -124,7 +121,6 @@ class TestMCPServerSetup:
         session = manager.get_current_session()
         assert len(session.history) == 0
 
-    @pytest.mark.asyncio
     async def test_voice_settings_integration(self):
         """Test voice settings through handlers."""
         manager = SessionManager()
@@ -150,7 +146,6 @@ class TestMCPServerSetup:
         assert "openai" in settings_text
         assert "nova" in settings_text
 
-    @pytest.mark.asyncio
     async def test_session_manager_cleanup_integration(self):
         """Test session cleanup functionality."""
         manager = SessionManager()
@@ -0,0 +1,72 @@
+"""Unit tests for the Stop hook's transcript reader."""
+
+import importlib.util
+import json
+from pathlib import Path
+
+import pytest
+
+HOOK_PATH = Path(__file__).parents[2] / "hooks" / "process_response.py"
+
+
+@pytest.fixture
+def hook(tmp_path, monkeypatch):
+    """Load the hook module with its transcript cache under tmp_path."""
+    spec = importlib.util.spec_from_file_location("process_response", HOOK_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    monkeypatch.setattr(module, "TRANSCRIPT_CACHE_DIR", tmp_path / "cache")
+    return module
+
+
+def line(text, role="assistant"):
+    """Build one transcript record."""
+    return json.dumps({"message": {"role": role, "content": text}})
+
+
+class TestExtractLastAssistantMessage:
+    """Tests for extract_last_assistant_message."""
+
+    def test_last_assistant_message(self, hook, tmp_path):
+        """Test the newest assistant record wins over older ones."""
+        transcript = tmp_path / "transcript.jsonl"
+        transcript.write_text(
+            line("one") + "\n" + line("two") + "\n" + line("hi", role="user") + "\n"
+        )
+
+        assert hook.extract_last_assistant_message(transcript) == "two"
+
+    def test_no_trailing_newline(self, hook, tmp_path):
+        """Test a complete final record without a newline is not skipped."""
+        transcript = tmp_path / "transcript.jsonl"
+        transcript.write_text(line("one") + "\n" + line("two"))
+
+        assert hook.extract_last_assistant_message(transcript) == "two"
+
+        # Appending after the unterminated record still finds the new one
+        with open(transcript, "a") as f:
+            f.write("\n" + line("three") + "\n")
+        assert hook.extract_last_assistant_message(transcript) == "three"
+
+    def test_partial_line_left_for_next_call(self, hook, tmp_path):
+        """Test a half-written final record is ignored until it completes."""
+        transcript = tmp_path / "transcript.jsonl"
+        full = line("two")
+        transcript.write_text(line("one") + "\n" + full[:10])
+
+        assert hook.extract_last_assistant_message(transcript) == "one"
+
+        with open(transcript, "a") as f:
+            f.write(full[10:] + "\n")
+        assert hook.extract_last_assistant_message(transcript) == "two"
+
+    def test_cache_file_is_private(self, hook, tmp_path):
+        """Test the parse state is written owner-only, one file per transcript."""
+        transcript = tmp_path / "transcript.jsonl"
+        transcript.write_text(line("one") + "\n")
+        hook.extract_last_assistant_message(transcript)
+
+        cache_file = hook._transcript_cache_file(transcript)
+        assert cache_file.parent == hook.TRANSCRIPT_CACHE_DIR
+        assert cache_file.stat().st_mode & 0o777 == 0o600
+        assert hook.TRANSCRIPT_CACHE_DIR.stat().st_mode & 0o777 == 0o700
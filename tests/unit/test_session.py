@@ -1,9 +1,19 @@
 """Unit tests for session management."""
 
+import json
+
 import pytest
 from datetime import datetime, timedelta
 
-from src.mcp_server.session import ConversationMessage, Session, SessionManager
+from src.mcp_server import session as session_module
+from src.mcp_server.session import (
+    DEFAULT_VOICE_SETTINGS,
+    MAX_HISTORY,
+    MESSAGE_TOKEN_OVERHEAD,
+    ConversationMessage,
+    Session,
+    SessionManager,
+)
 
 
 class TestConversationMessage:
@@ -42,6 +52,15 @@ class TestConversationMessage:
         assert data["narration"] == "Summary"
         assert "timestamp" in data
 
+    def test_to_json_matches_to_dict(self):
+        """Test JSON serialization matches the dict form and is memoized."""
+        msg = ConversationMessage(role="assistant", content='Say "hi"', narration="Greeting")
+
+        encoded = msg.to_json()
+
+        assert json.loads(encoded) == msg.to_dict()
+        assert msg.to_json() is encoded
+
 
 class TestSession:
     """Tests for Session class."""
@@ -54,6 +73,14 @@ class TestSession:
         assert isinstance(session.voice_settings, dict)
         assert session.voice_settings["tts_provider"] == "local"
 
+    def test_default_voice_settings_are_copied(self):
+        """Test sessions don't share the default settings dict."""
+        session = Session()
+        session.update_voice_settings({"tts_provider": "openai"})
+
+        assert DEFAULT_VOICE_SETTINGS["tts_provider"] == "local"
+        assert Session().voice_settings == DEFAULT_VOICE_SETTINGS
+
     def test_add_message(self):
         """Test adding messages to session."""
         session = Session()
@@ -97,6 +124,93 @@ class TestSession:
         session.clear()
         assert len(session.history) == 0
 
+    def test_summarize_and_evict(self, tmp_path, monkeypatch):
+        """Test older messages are replaced by a summary and archived."""
+        archive_dir = tmp_path / "archives"
+        monkeypatch.setenv("HISTORY_ARCHIVE_DIR", str(archive_dir))
+        session = Session()
+        for i in range(5):
+            session.add_message("user", f"Authentication question {i}")
+
+        summary = session.summarize_and_evict(keep_recent=2)
+
+        assert [msg.content for msg in session.history][1:] == [
+            "Authentication question 3",
+            "Authentication question 4",
+        ]
+        assert session.history[0] is summary
+        assert summary.role == "system"
+        assert summary.meta == {"summarized_count": 3}
+        assert "authentication" in summary.content
+        assert session.token_budget_used() == sum(m.token_estimate for m in session.history)
+
+        # The archive is written on its own thread
+        session_module._archive_executor.submit(lambda: None).result()
+        archive_file, = archive_dir.iterdir()
+        assert archive_dir.stat().st_mode & 0o777 == 0o700
+        assert archive_file.stat().st_mode & 0o777 == 0o600
+        archived = [json.loads(line) for line in archive_file.open()]
+        assert [a["message"]["content"] for a in archived] == [
+            f"Authentication question {i}" for i in range(3)
+        ]
+        assert archived[0]["session_id"] == session.session_id
+
+        # Nothing left to summarize
+        assert session.summarize_and_evict(keep_recent=3) is None
+
+    def test_token_budget_triggers_summary(self, monkeypatch):
+        """Test add_message summarizes once the token budget is exceeded."""
+        monkeypatch.setenv("HISTORY_ARCHIVE", "false")
+        session = Session(token_budget=500)
+        for i in range(60):
+            session.add_message("user", "x" * 40)
+            assert session.token_budget_used() <= 500
+
+        assert session.history[0].role == "system"
+        assert session.history[0].meta["summarized_count"] + len(session.history) - 1 == 60
+
+    def test_history_is_bounded(self):
+        """Test that the oldest messages are dropped past MAX_HISTORY."""
+        session = Session()
+        for i in range(MAX_HISTORY + 1):
+            session.add_message("user", f"Message {i}")
+
+        assert len(session.history) == MAX_HISTORY
+        assert session.history[0].content == "Message 1"
+        assert session.get_history(limit=1)[0].content == f"Message {MAX_HISTORY}"
+
+    def test_token_estimate_tracks_history(self):
+        """Test the running token count follows adds, evictions and clear."""
+        session = Session(max_history=2)
+        first = session.add_message("user", "x" * 40)
+        second = session.add_message("assistant", "y" * 20, "z" * 20)
+        assert first.token_estimate == 10 + MESSAGE_TOKEN_OVERHEAD
+        assert session.token_budget_used() == first.token_estimate + second.token_estimate
+
+        third = session.add_message("user", "Hi")
+        assert session.token_budget_used() == second.token_estimate + third.token_estimate
+
+        session.clear()
+        assert session.token_budget_used() == 0
+
+    def test_history_cap_is_configurable(self):
+        """Test that max_history sets the sliding window size."""
+        session = Session(max_history=2)
+        for i in range(3):
+            session.add_message("user", f"Message {i}")
+
+        assert [msg.content for msg in session.get_history()] == ["Message 1", "Message 2"]
+        assert "max_history" not in session.to_dict()
+
+    def test_voice_controller_is_reused(self):
+        """Test that a session hands out the same voice controller."""
+        session = Session()
+
+        controller = session.voice_controller()
+        assert controller.session is session
+        assert session.voice_controller() is controller
+        assert "_voice_controller" not in session.to_dict()
+
     def test_update_voice_settings(self):
         """Test updating voice settings."""
         session = Session()
@@ -124,6 +238,32 @@ class TestSession:
         assert "created_at" in data
         assert "last_activity" in data
 
+    def test_to_json(self):
+        """Test serializing session to JSON."""
+        session = Session()
+        session.add_message("user", "Test message")
+        session.add_message("assistant", "Reply", "Summary")
+
+        assert json.loads(session.to_json()) == session.to_dict()
+        assert json.loads(session.history_json()) == session.to_dict()["history"]
+
+
+    def test_history_json_follows_appends_and_evictions(self):
+        """Test the cached history JSON stays in step with the deque."""
+        session = Session(max_history=3)
+        assert session.history_json() == "[]"
+
+        for i in range(5):
+            session.add_message("user", f"Message {i}")
+            expected = [msg.to_dict() for msg in session.history]
+            assert json.loads(session.history_json()) == expected
+            # Unchanged history hands back the cached string, not a rebuilt copy
+            assert session.history_json() is session.history_json()
+
+        session.clear()
+        session.add_message("assistant", "Fresh start")
+        assert [m["content"] for m in json.loads(session.history_json())] == ["Fresh start"]
+
 
 class TestSessionManager:
     """Tests for SessionManager class."""
@@ -135,6 +275,14 @@ class TestSessionManager:
         session = manager.create_session()
         assert session.session_id
         assert session.session_id in manager.sessions
+        assert session.token_budget is None
+
+    @pytest.mark.parametrize("value,budget", [("4000", 4000), ("0", None), ("lots", None)])
+    def test_create_session_token_budget(self, monkeypatch, value, budget):
+        """Test new sessions take their token budget from HISTORY_TOKEN_BUDGET."""
+        monkeypatch.setenv("HISTORY_TOKEN_BUDGET", value)
+
+        assert SessionManager().create_session().token_budget == budget
 
     def test_get_session(self):
         """Test getting a session by ID."""
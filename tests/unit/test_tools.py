@@ -1,7 +1,6 @@
 """Unit tests for MCP tools."""
 
 import pytest
-from unittest.mock import AsyncMock, Mock, patch
 
 from mcp.types import TextContent
 
@@ -9,52 +8,69 @@ from src.mcp_server.session import SessionManager
 from src.mcp_server.tools import ToolHandler, create_tools
 
 
+EXPECTED_TOOLS = frozenset({
+    "send_message",
+    "get_conversation_history",
+    "clear_conversation",
+    "set_voice_settings",
+    "get_voice_settings",
+    "listen",
+})
+
+
+def seed_history(session, messages):
+    """Add (role, content) pairs to a session through add_message."""
+    for role, content in messages:
+        session.add_message(role, content)
+
+
+@pytest.fixture(scope="module")
+def tools():
+    """Tool definitions, built once; the tests only read them."""
+    return create_tools()
+
+
+@pytest.fixture
+def handler_pair():
+    """A fresh session manager and the tool handler bound to it."""
+    manager = SessionManager()
+    return manager, ToolHandler(manager)
+
+
 class TestCreateTools:
     """Tests for create_tools function."""
 
-    def test_create_tools_returns_list(self):
+    def test_create_tools_returns_list(self, tools):
         """Test that create_tools returns a list."""
-        tools = create_tools()
         assert isinstance(tools, list)
         assert len(tools) > 0
 
-    def test_all_tools_have_required_fields(self):
+    def test_all_tools_have_required_fields(self, tools):
         """Test that all tools have required fields."""
-        tools = create_tools()
-
         for tool in tools:
             assert hasattr(tool, 'name')
             assert hasattr(tool, 'description')
             assert hasattr(tool, 'inputSchema')
 
-    def test_expected_tools_present(self):
+    def test_expected_tools_present(self, tools):
         """Test that expected tools are present."""
-        tools = create_tools()
-        tool_names = [tool.name for tool in tools]
+        tool_names = {tool.name for tool in tools}
 
-        assert "send_message" in tool_names
-        assert "get_conversation_history" in tool_names
-        assert "clear_conversation" in tool_names
-        assert "set_voice_settings" in tool_names
-        assert "get_voice_settings" in tool_names
-        assert "listen" in tool_names
+        assert EXPECTED_TOOLS <= tool_names
 
 
 class TestToolHandler:
     """Tests for ToolHandler class."""
 
-    def test_create_handler(self):
+    def test_create_handler(self, handler_pair):
         """Test creating a tool handler."""
-        manager = SessionManager()
-        handler = ToolHandler(manager)
+        manager, handler = handler_pair
 
         assert handler.session_manager is manager
 
-    @pytest.mark.asyncio
-    async def test_send_message(self):
+    async def test_send_message(self, handler_pair):
         """Test send_message tool."""
-        manager = SessionManager()
-        handler = ToolHandler(manager)
+        manager, handler = handler_pair
 
         arguments = {
             "text": "Hello, world!",
@@ -74,11 +90,9 @@ class TestToolHandler:
         assert session.history[0].content == "Hello, world!"
         assert session.history[0].role == "user"
 
-    @pytest.mark.asyncio
-    async def test_send_message_with_voice(self):
+    async def test_send_message_with_voice(self, handler_pair):
         """Test send_message with voice enabled."""
-        manager = SessionManager()
-        handler = ToolHandler(manager)
+        manager, handler = handler_pair
 
         arguments = {
             "text": "[VOICE_NARRATION]Summary[/VOICE_NARRATION]Full message",
@@ -86,8 +100,7 @@ class TestToolHandler:
             "role": "assistant"
         }
 
-        with patch('src.mcp_server.voice_controller.subprocess.Popen'):
-            result = await handler.send_message(arguments)
+        result = await handler.send_message(arguments)
 
         assert isinstance(result, list)
 
@@ -97,11 +110,27 @@ class TestToolHandler:
         assert session.history[0].narration is not None
         assert "Summary" in session.history[0].narration
 
-    @pytest.mark.asyncio
-    async def test_get_conversation_history_empty(self):
+    async def test_send_messages(self, handler_pair):
+        """Test adding several messages in one batch."""
+        manager, handler = handler_pair
+
+        payloads = [
+            {"text": "Question"},
+            {"text": "[VOICE_NARRATION]Summary[/VOICE_NARRATION]Answer", "use_voice": True,
+             "role": "assistant"},
+        ]
+
+        result = await handler.send_messages(payloads)
+
+        assert len(result) == 2
+        session = manager.get_current_session()
+        assert [msg.role for msg in session.history] == ["user", "assistant"]
+        assert session.history[0].narration is None
+        assert "Summary" in session.history[1].narration
+
+    async def test_get_conversation_history_empty(self, handler_pair):
         """Test getting history from empty conversation."""
-        manager = SessionManager()
-        handler = ToolHandler(manager)
+        manager, handler = handler_pair
 
         result = await handler.get_conversation_history({})
 
@@ -109,58 +138,38 @@ class TestToolHandler:
         assert len(result) == 1
         assert "No conversation history" in result[0].text
 
-    @pytest.mark.asyncio
-    async def test_get_conversation_history(self):
-        """Test getting conversation history."""
-        manager = SessionManager()
-        handler = ToolHandler(manager)
+    @pytest.mark.parametrize("arguments,expected", [
+        ({}, ["Message 1", "Response 1", "Message 2"]),
+        ({"limit": 2}, ["Response 1", "Message 2"]),  # Oldest should be excluded
+    ])
+    async def test_get_conversation_history(self, handler_pair, arguments, expected):
+        """Test getting full and limited conversation history."""
+        manager, handler = handler_pair
 
         # Add some messages
         session = manager.get_current_session()
-        session.add_message("user", "Message 1")
-        session.add_message("assistant", "Response 1")
-        session.add_message("user", "Message 2")
+        seed_history(session, [
+            ("user", "Message 1"),
+            ("assistant", "Response 1"),
+            ("user", "Message 2"),
+        ])
 
-        result = await handler.get_conversation_history({})
+        result = await handler.get_conversation_history(arguments)
 
         assert isinstance(result, list)
         assert len(result) > 0
         text = result[0].text
-        assert "3 messages" in text
-        assert "Message 1" in text
-        assert "Response 1" in text
-        assert "Message 2" in text
-
-    @pytest.mark.asyncio
-    async def test_get_conversation_history_with_limit(self):
-        """Test getting limited conversation history."""
-        manager = SessionManager()
-        handler = ToolHandler(manager)
-
-        # Add some messages
-        session = manager.get_current_session()
-        session.add_message("user", "Message 1")
-        session.add_message("assistant", "Response 1")
-        session.add_message("user", "Message 2")
-
-        result = await handler.get_conversation_history({"limit": 2})
-
-        text = result[0].text
-        assert "2 messages" in text
-        assert "Message 1" not in text  # Oldest should be excluded
-        assert "Response 1" in text
-        assert "Message 2" in text
+        assert f"{len(expected)} messages" in text
+        for content in ["Message 1", "Response 1", "Message 2"]:
+            assert (content in text) == (content in expected)
 
-    @pytest.mark.asyncio
-    async def test_clear_conversation(self):
+    async def test_clear_conversation(self, handler_pair):
         """Test clearing conversation."""
-        manager = SessionManager()
-        handler = ToolHandler(manager)
+        manager, handler = handler_pair
 
         # Add some messages
         session = manager.get_current_session()
-        session.add_message("user", "Message 1")
-        session.add_message("user", "Message 2")
+        seed_history(session, [("user", "Message 1"), ("user", "Message 2")])
 
         result = await handler.clear_conversation({})
 
@@ -170,11 +179,9 @@ class TestToolHandler:
         # Verify history is cleared
         assert len(session.history) == 0
 
-    @pytest.mark.asyncio
-    async def test_set_voice_settings(self):
+    async def test_set_voice_settings(self, handler_pair):
         """Test setting voice settings."""
-        manager = SessionManager()
-        handler = ToolHandler(manager)
+        manager, handler = handler_pair
 
         arguments = {
             "tts_provider": "openai",
@@ -198,11 +205,9 @@ class TestToolHandler:
         assert session.voice_settings["auto_speak"] is False
         assert session.voice_settings["verbosity"] == "detailed"
 
-    @pytest.mark.asyncio
-    async def test_get_voice_settings(self):
+    async def test_get_voice_settings(self, handler_pair):
         """Test getting voice settings."""
-        manager = SessionManager()
-        handler = ToolHandler(manager)
+        manager, handler = handler_pair
 
         result = await handler.get_voice_settings({})
 
@@ -212,11 +217,9 @@ class TestToolHandler:
         assert "tts_provider" in text
         assert "auto_speak" in text
 
-    @pytest.mark.asyncio
-    async def test_handle_call_tool_routing(self):
+    async def test_handle_call_tool_routing(self, handler_pair):
         """Test that handle_call_tool routes to correct handler."""
-        manager = SessionManager()
-        handler = ToolHandler(manager)
+        manager, handler = handler_pair
 
         # Test routing to clear_conversation
         result = await handler.handle_call_tool("clear_conversation", {})
@@ -226,11 +229,17 @@ class TestToolHandler:
         result = await handler.handle_call_tool("unknown_tool", {})
         assert "Unknown tool" in result[0].text
 
-    @pytest.mark.asyncio
-    async def test_send_message_defaults(self):
+    async def test_handle_call_tool_missing_required(self, handler_pair):
+        """Test that missing required arguments are reported, not raised."""
+        manager, handler = handler_pair
+
+        result = await handler.handle_call_tool("send_message", {"use_voice": False})
+        assert "Missing required arguments for send_message: text" in result[0].text
+        assert len(manager.get_current_session().history) == 0
+
+    async def test_send_message_defaults(self, handler_pair):
         """Test send_message with default values."""
-        manager = SessionManager()
-        handler = ToolHandler(manager)
+        manager, handler = handler_pair
 
         # Only provide required text argument
         arguments = {"text": "Test message"}
@@ -1,38 +1,48 @@
 """Unit tests for voice controller."""
 
+import threading
+
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import MagicMock, patch
 
 from src.mcp_server.session import Session
+from src.mcp_server import voice_controller
 from src.mcp_server.voice_controller import VoiceController
 
+# Message with a single narration block, shared by the process_message tests
+NARRATION_TEXT = "[VOICE_NARRATION]Summary[/VOICE_NARRATION]Full text"
+
+
+@pytest.fixture
+def controller_pair():
+    """A fresh session and the voice controller bound to it."""
+    session = Session()
+    return session, VoiceController(session)
+
 
 class TestVoiceController:
     """Tests for VoiceController class."""
 
-    def test_create_controller(self):
+    def test_create_controller(self, controller_pair):
         """Test creating a voice controller."""
-        session = Session()
-        controller = VoiceController(session)
+        session, controller = controller_pair
 
         assert controller.session is session
         assert controller._tts_provider is None
         assert controller._stt_provider is None
 
-    def test_extract_narration_no_tags(self):
+    def test_extract_narration_no_tags(self, controller_pair):
         """Test extracting narration when no tags present."""
-        session = Session()
-        controller = VoiceController(session)
+        _, controller = controller_pair
 
         text = "Regular text without narration tags"
         narration = controller.extract_and_speak_narration(text)
 
         assert narration is None
 
-    def test_extract_narration_with_tags(self):
+    def test_extract_narration_with_tags(self, controller_pair, monkeypatch):
         """Test extracting narration from text with tags."""
-        session = Session()
-        controller = VoiceController(session)
+        _, controller = controller_pair
 
         text = """
         Some output here.
@@ -44,55 +54,67 @@ class TestVoiceController:
         More output.
         """
 
-        with patch.object(controller, 'speak_async'):
-            narration = controller.extract_and_speak_narration(text)
+        monkeypatch.setattr(controller, 'speak_async', lambda text: None)
+        narration = controller.extract_and_speak_narration(text)
 
         assert narration is not None
         assert "This is the narration to be spoken" in narration
 
-    def test_extract_narration_disabled(self):
-        """Test narration extraction when disabled."""
-        session = Session()
-        session.voice_settings["narration_enabled"] = False
-        controller = VoiceController(session)
+    @pytest.mark.parametrize("setting", ["narration_enabled", "auto_speak"])
+    def test_extract_narration_speech_disabled(self, controller_pair, setting, monkeypatch):
+        """Test narration is extracted but not spoken when either switch is off."""
+        session, controller = controller_pair
+        session.voice_settings[setting] = False
 
         text = "[VOICE_NARRATION]Test[/VOICE_NARRATION]"
 
-        with patch.object(controller, 'speak_async') as mock_speak:
-            narration = controller.extract_and_speak_narration(text)
+        mock_speak = MagicMock()
+        monkeypatch.setattr(controller, 'speak_async', mock_speak)
+        narration = controller.extract_and_speak_narration(text)
 
         # Should still extract but not speak
         assert narration is not None
         mock_speak.assert_not_called()
 
-    def test_extract_narration_auto_speak_disabled(self):
-        """Test narration with auto_speak disabled."""
-        session = Session()
-        session.voice_settings["auto_speak"] = False
-        controller = VoiceController(session)
+    def test_speak_async(self, mock_popen, controller_pair):
+        """Test asynchronous speech."""
+        _, controller = controller_pair
 
-        text = "[VOICE_NARRATION]Test[/VOICE_NARRATION]"
+        controller.speak_async("Test text")
 
-        with patch.object(controller, 'speak_async') as mock_speak:
-            narration = controller.extract_and_speak_narration(text)
+        mock_popen.assert_called_once()
 
-        assert narration is not None
-        mock_speak.assert_not_called()
+    def test_speak_async_dry_run(self, controller_pair, monkeypatch):
+        """Test that VOICE_DRY_RUN skips speech entirely."""
+        _, controller = controller_pair
+        monkeypatch.setattr(controller, '_get_tts_provider', MagicMock())
 
-    @patch('src.mcp_server.voice_controller.subprocess.Popen')
-    def test_speak_async(self, mock_popen):
-        """Test asynchronous speech."""
-        session = Session()
-        controller = VoiceController(session)
+        controller.speak_async("Test text")
+
+        controller._get_tts_provider.assert_not_called()
+        assert voice_controller._worker is None
+
+    @patch('src.mcp_server.voice_controller.SPEAK_SCRIPT_EXISTS', False)
+    @patch('src.mcp_server.voice_controller.get_tts_provider')
+    def test_speak_async_fallback_runs_in_background(
+        self, mock_get_provider, controller_pair, live_speech
+    ):
+        """Test that in-process speech does not run on the caller's thread."""
+        _, controller = controller_pair
+        speaking_threads = []
+        mock_get_provider.return_value.speak.side_effect = (
+            lambda text: speaking_threads.append(threading.current_thread())
+        )
 
         controller.speak_async("Test text")
+        voice_controller._speech_executor.submit(lambda: None).result()
 
-        mock_popen.assert_called_once()
+        assert len(speaking_threads) == 1
+        assert speaking_threads[0] is not threading.current_thread()
 
-    def test_update_settings(self):
+    def test_update_settings(self, controller_pair):
         """Test updating voice settings."""
-        session = Session()
-        controller = VoiceController(session)
+        session, controller = controller_pair
 
         # Initial provider should be None
         assert controller._tts_provider is None
@@ -109,13 +131,12 @@ class TestVoiceController:
         assert session.voice_settings["tts_voice"] == "nova"
         assert session.voice_settings["auto_speak"] is False
 
-    def test_update_settings_invalidates_provider(self):
+    def test_update_settings_invalidates_provider(self, controller_pair):
         """Test that updating settings invalidates cached providers."""
-        session = Session()
-        controller = VoiceController(session)
+        _, controller = controller_pair
 
-        # Set a mock provider
-        controller._tts_provider = Mock()
+        # Any cached provider will do; it is only checked for being dropped
+        controller._tts_provider = object()
 
         # Update TTS settings
         controller.update_settings(tts_provider="openai")
@@ -123,43 +144,70 @@ class TestVoiceController:
         # Provider should be invalidated
         assert controller._tts_provider is None
 
-    def test_process_message_sync(self):
-        """Test synchronous message processing."""
-        session = Session()
-        controller = VoiceController(session)
-
-        text = "[VOICE_NARRATION]Summary[/VOICE_NARRATION]Full text"
-
-        with patch.object(controller, 'speak_async'):
-            result_text, narration = controller.process_message_sync(text)
+    @patch('src.mcp_server.voice_controller.get_tts_provider')
+    def test_provider_follows_session_settings(self, mock_get_provider, controller_pair):
+        """Test that the cached provider is rebuilt when session settings change."""
+        session, controller = controller_pair
 
-        assert result_text == text
-        assert "Summary" in narration
-
-    def test_process_message_sync_no_extraction(self):
-        """Test message processing without extraction."""
-        session = Session()
-        controller = VoiceController(session)
-
-        text = "[VOICE_NARRATION]Summary[/VOICE_NARRATION]Full text"
+        first = controller._get_tts_provider()
+        assert controller._get_tts_provider() is first
+        assert mock_get_provider.call_count == 1
 
-        with patch.object(controller, 'extract_and_speak_narration') as mock_extract:
-            result_text, narration = controller.process_message_sync(text, extract_voice=False)
+        # Settings changed on the session itself, not through the controller
+        session.update_voice_settings({"tts_voice": "nova"})
+        controller._get_tts_provider()
+        assert mock_get_provider.call_count == 2
 
-        assert result_text == text
-        assert narration is None
-        mock_extract.assert_not_called()
+    @patch('src.mcp_server.voice_controller.get_stt_provider')
+    def test_replaced_stt_provider_is_closed(self, mock_get_provider, controller_pair):
+        """Test that switching STT provider releases the old one's stream."""
+        _, controller = controller_pair
 
-    @pytest.mark.asyncio
-    async def test_process_message_async(self):
-        """Test asynchronous message processing."""
-        session = Session()
-        controller = VoiceController(session)
+        first = controller._get_stt_provider()
+        controller.update_settings(stt_provider="local")
 
-        text = "[VOICE_NARRATION]Summary[/VOICE_NARRATION]Full text"
+        first.close.assert_called_once()
+        assert controller._stt_provider is None
 
-        with patch.object(controller, 'speak_async'):
-            result_text, narration = await controller.process_message_async(text)
+    @patch('src.mcp_server.voice_controller.get_stt_provider')
+    def test_listen_releases_microphone(self, mock_get_provider, controller_pair):
+        """Test that listen closes the stream but keeps the provider cached."""
+        _, controller = controller_pair
+        provider = mock_get_provider.return_value
+        provider.listen.return_value = "hello"
+
+        assert controller.listen(duration=1) == "hello"
+        provider.close.assert_called_once()
+        assert controller._stt_provider is provider
+
+        provider.listen.side_effect = RuntimeError("no device")
+        with pytest.raises(RuntimeError):
+            controller.listen(duration=1)
+        assert provider.close.call_count == 2
+        mock_get_provider.assert_called_once()
+
+    @pytest.mark.parametrize("is_async,extract_voice", [
+        (False, True),
+        (False, False),
+        (True, True),
+    ])
+    async def test_process_message(self, controller_pair, monkeypatch, is_async, extract_voice):
+        """Test sync and async message processing, with and without extraction."""
+        _, controller = controller_pair
+
+        text = NARRATION_TEXT
+
+        monkeypatch.setattr(controller, 'speak_async', lambda text: None)
+        mock_extract = MagicMock(wraps=controller.extract_and_speak_narration)
+        monkeypatch.setattr(controller, 'extract_and_speak_narration', mock_extract)
+        if is_async:
+            result_text, narration = await controller.process_message_async(text, extract_voice)
+        else:
+            result_text, narration = controller.process_message_sync(text, extract_voice)
 
         assert result_text == text
-        assert "Summary" in narration
+        if extract_voice:
+            assert "Summary" in narration
+        else:
+            assert narration is None
+            mock_extract.assert_not_called()